@@ -60,7 +60,9 @@ class ContributorProfile(models.Model):
     platform = models.CharField(max_length=20, default='github')
     profile_url = models.URLField()
     avatar_url = models.URLField(blank=True, null=True)
-    google_user = models.OneToOneField('GoogleUser', on_delete=models.CASCADE, null=True, blank=True)
+    google_user = models.OneToOneField(
+        'GoogleUser', on_delete=models.CASCADE, null=True, blank=True, related_name='contributor_profile'
+    )
     
     # Activity metrics
     activity_score = models.FloatField(default=0.0)
@@ -11,24 +11,14 @@ from datetime import datetime, timedelta
 import logging
 
 from .models import GoogleUser, RealIssue, RealComment, GitHubUser, RealActivityLog, InactiveAssigneeDetection
-from .services.real_github_service import RealGitHubService, TrustScoreCalculator, CookieLickingDetector
-from django.conf import settings
+from .services.real_github_service import EVENT_POINTS, TrustScoreCalculator, CookieLickingDetector
+from .services.real_github_factory import get_github_service
+from .tasks import check_inactive_contributors_task
 
 logger = logging.getLogger(__name__)
 
-
-def get_github_service(user_id: int = None) -> RealGitHubService:
-    """Get GitHub service with user's access token if available"""
-    if user_id:
-        try:
-            user = GoogleUser.objects.get(id=user_id)
-            return RealGitHubService(access_token=user.github_access_token)
-        except GoogleUser.DoesNotExist:
-            pass
-    
-    # Use the global GitHub token from settings
-    access_token = getattr(settings, 'GITHUB_ACCESS_TOKEN', None)
-    return RealGitHubService(access_token=access_token)
+# Newest issues returned by get_user_issues
+ISSUE_LIST_LIMIT = 10
 
 
 @api_view(['GET'])
@@ -47,16 +37,32 @@ def get_user_issues(request):
         github_service = get_github_service(user_id)
         logger.info("✅ GitHub service created")
         
-        # Fetch issues from GitHub API
+        # Fetch the newest issues with their comments in one GraphQL query,
+        # falling back to the REST listing (without comments) when unavailable
         logger.info("📋 Fetching issues from GitHub...")
-        github_issues = github_service.get_repo_issues(repo_owner, repo_name)
+        github_issues = github_service.get_repo_issues_with_comments(repo_owner, repo_name, count=ISSUE_LIST_LIMIT)
+        if github_issues is None:
+            github_issues = github_service.get_repo_issues(
+                repo_owner, repo_name, per_page=ISSUE_LIST_LIMIT, max_pages=1
+            )
         logger.info(f"✅ Got {len(github_issues)} issues")
         
+        # Trust scores of every commenter, looked up in one query
+        commenters = {
+            comment['user_login']
+            for issue in github_issues[:ISSUE_LIST_LIMIT]
+            for comment in issue.get('recent_comments', ())
+            if comment['user_login']
+        }
+        known_users = {
+            user.username: user for user in GitHubUser.objects.filter(username__in=commenters)
+        } if commenters else {}
+        
         processed_issues = []
         
-        for i, issue in enumerate(github_issues[:10]):  # Process only first 10 for debugging
+        for i, issue in enumerate(github_issues[:ISSUE_LIST_LIMIT]):
             try:
-                logger.info(f"📝 Processing issue {i+1}/10: #{issue.get('number')}")
+                logger.info(f"📝 Processing issue {i+1}/{ISSUE_LIST_LIMIT}: #{issue.get('number')}")
                 
                 # Store/update issue in database  
                 issue_obj, created = RealIssue.objects.update_or_create(
@@ -79,9 +85,27 @@ def get_user_issues(request):
                 logger.error(f"❌ Error processing issue #{issue.get('number', 'unknown')}: {issue_error}")
                 continue
             
-            # Skip comments processing for debugging
             comment_data = []
-            trust_scores = []
+            trust_scores = {}
+            for comment in issue.get('recent_comments', ()):
+                username = comment['user_login']
+                if not username:
+                    continue
+                
+                comment_data.append({
+                    'username': username,
+                    'body': comment['body'],
+                    'created_at': comment['created_at'],
+                    'reactions': comment['reactions']
+                })
+                
+                if username not in trust_scores:
+                    github_user = known_users.get(username)
+                    trust_scores[username] = {
+                        'username': username,
+                        'score': github_user.trust_score if github_user else 0,
+                        'tag': github_user.tag if github_user else 'Unknown'
+                    }
             
             # Format response as specified
             processed_issue = {
@@ -92,7 +116,7 @@ def get_user_issues(request):
                 'assignee': issue.get('assignee', {}).get('login') if issue.get('assignee') else None,
                 'status': 'Assigned' if issue.get('assignee') else 'Unassigned',
                 'comments': comment_data,
-                'trust_scores': trust_scores,
+                'trust_scores': list(trust_scores.values()),
                 'created_at': issue['created_at'],
                 'updated_at': issue['updated_at']
             }
@@ -187,43 +211,36 @@ def get_contributor_activity(request, username):
                 'error': trust_result['error']
             }, status=status.HTTP_404_NOT_FOUND)
         
-        # Get user events
-        events = github_service.get_user_events(username)
+        # The scored events travel with the result, so a cached score needs no
+        # further GitHub calls; they were stored when the score was computed
+        events = trust_result.get('recent_events', [])
         
-        # Store activity logs
-        for event in events[:10]:  # Store recent 10 events
-            event_type = event.get('type')
-            points = 0
-            
-            if event_type == 'PushEvent':
-                points = 3
-            elif event_type == 'PullRequestEvent':
-                points = 2
-            elif event_type == 'IssueCommentEvent':
-                points = 2
+        if not trust_result.get('cached'):
+            # Store activity logs
+            for event in events:
+                event_type = event.get('type')
+                RealActivityLog.objects.update_or_create(
+                    event_id=event['id'],
+                    defaults={
+                        'username': username,
+                        'event_type': event_type,
+                        'repo_name': event.get('repo', {}).get('name', ''),
+                        'event_data': event,
+                        'trust_score_points': EVENT_POINTS.get(event_type, 0),
+                        'created_at_github': datetime.fromisoformat(event['created_at'].replace('Z', '+00:00')),
+                    }
+                )
             
-            RealActivityLog.objects.update_or_create(
-                event_id=event['id'],
+            # Update/create GitHub user
+            GitHubUser.objects.update_or_create(
+                username=username,
                 defaults={
-                    'username': username,
-                    'event_type': event_type,
-                    'repo_name': event.get('repo', {}).get('name', ''),
-                    'event_data': event,
-                    'trust_score_points': points,
-                    'created_at_github': datetime.fromisoformat(event['created_at'].replace('Z', '+00:00')),
+                    'trust_score': trust_result['trust_score'],
+                    'tag': trust_result['tag'],
+                    'last_activity_check': timezone.now(),
                 }
             )
         
-        # Update/create GitHub user
-        GitHubUser.objects.update_or_create(
-            username=username,
-            defaults={
-                'trust_score': trust_result['trust_score'],
-                'tag': trust_result['tag'],
-                'last_activity_check': timezone.now(),
-            }
-        )
-        
         return Response({
             'username': username,
             'trust_score': trust_result['trust_score'],
@@ -251,48 +268,92 @@ def analyze_inactive_contributors(request):
     user_id = request.data.get('user_id')
     
     try:
-        github_service = get_github_service(user_id)
-        trust_calculator = TrustScoreCalculator(github_service)
-        detector = CookieLickingDetector(github_service, trust_calculator)
-        
-        # Check for inactive contributors
-        inactive_detections = detector.check_inactive_contributors(repo_owner, repo_name)
-        
-        # Store detections in database
-        for detection in inactive_detections:
-            try:
-                issue = RealIssue.objects.get(
-                    repo_owner=repo_owner,
-                    repo_name=repo_name,
-                    issue_number=detection['issue_number']
-                )
-                
-                InactiveAssigneeDetection.objects.update_or_create(
-                    issue=issue,
-                    assignee_username=detection['assignee'],
-                    defaults={
-                        'days_inactive': detection['days_inactive'],
-                        'trust_score_at_detection': detection['trust_score'],
-                    }
-                )
-            except RealIssue.DoesNotExist:
-                logger.warning(f"Issue #{detection['issue_number']} not found in database")
+        # The scan can take minutes, so run it on a worker and return right away
+        job = check_inactive_contributors_task.delay(repo_owner, repo_name, user_id)
         
         return Response({
             'success': True,
             'repository': f"{repo_owner}/{repo_name}",
-            'inactive_contributors_detected': len(inactive_detections),
-            'detections': inactive_detections
-        })
+            'job_id': job.id,
+            'status': 'queued'
+        }, status=status.HTTP_202_ACCEPTED)
         
     except Exception as e:
-        logger.error(f"Error analyzing inactive contributors: {e}")
+        logger.error(f"Error queueing inactive contributor check: {e}")
         return Response({
             'success': False,
             'error': str(e)
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def get_inactive_contributors_job(request, job_id):
+    """
+    /api/real/inactive-contributors/<job_id>/ → Poll a scan queued by analyze_inactive_contributors
+    """
+    result = check_inactive_contributors_task.AsyncResult(str(job_id))
+    
+    if result.failed():
+        return Response({
+            'success': False,
+            'job_id': str(job_id),
+            'status': 'failed',
+            'error': str(result.result)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    
+    if not result.ready():
+        # PENDING also covers ids the result backend has never seen
+        return Response({
+            'success': True,
+            'job_id': str(job_id),
+            'status': result.state.lower()
+        }, status=status.HTTP_202_ACCEPTED)
+    
+    detections = result.result or []
+    return Response({
+        'success': True,
+        'job_id': str(job_id),
+        'status': 'finished',
+        'inactive_contributors_detected': len(detections),
+        'detections': detections
+    })
+
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def get_inactive_detections(request):
+    """
+    /api/real/inactive-contributors/detections/ → Stored inactive assignee detections
+    """
+    repo_owner = request.GET.get('repo_owner', 'aaneesa')
+    repo_name = request.GET.get('repo_name', 'Gurukul-2.0')
+    
+    detections = InactiveAssigneeDetection.objects.filter(
+        issue__repo_owner=repo_owner,
+        issue__repo_name=repo_name
+    ).select_related('issue').order_by('-updated_at')
+    
+    return Response({
+        'success': True,
+        'repository': f"{repo_owner}/{repo_name}",
+        'inactive_contributors_detected': len(detections),
+        'detections': [
+            {
+                'issue_number': detection.issue.issue_number,
+                'issue_title': detection.issue.title,
+                'assignee': detection.assignee_username,
+                'trust_score': detection.trust_score_at_detection,
+                'days_inactive': detection.days_inactive,
+                'reminder_sent': detection.reminder_sent,
+                'unassigned': detection.unassigned,
+                'detected_at': detection.updated_at.isoformat()
+            }
+            for detection in detections
+        ]
+    })
+
+
 @api_view(['POST'])
 @permission_classes([AllowAny])
 def send_reminder(request):
@@ -0,0 +1,29 @@
+"""
+Response renderers for the Cookie-Licking Detection API
+"""
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+_ORJSON_OPTIONS = (
+    orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer backed by orjson, which encodes the large nested analysis
+    payloads several times faster than the stdlib encoder. Types orjson does
+    not know (Decimal, lazy strings, ...) go through DRF's encoder; without
+    orjson installed this is DRF's JSONRenderer.
+    """
+    
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        
+        return orjson.dumps(data, default=JSONEncoder().default, option=_ORJSON_OPTIONS)
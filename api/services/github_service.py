@@ -2,19 +2,182 @@
 GitHub API service for Cookie-Licking Detection
 Handles all GitHub API interactions for analyzing contributor behavior
 """
+import hashlib
 import requests
 import re
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterator, List, Dict, Optional, Tuple
 import logging
+import numpy as np
+from cachetools import LRUCache, TLRUCache, TTLCache
 from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import regex as _regex
+except ImportError:  # pragma: no cover - optional accelerator
+    _regex = None
+
+try:
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:  # pragma: no cover - optional accelerator
+    from json import dumps as json_dumps, loads as json_loads
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional accelerator
+    ahocorasick = None
+
+try:
+    import hyperscan
+except ImportError:  # pragma: no cover - optional accelerator
+    hyperscan = None
+
+from .redis_client import RedisError, get_redis
 
 logger = logging.getLogger(__name__)
 
+# Fields read from GitHub payloads by the trust-score and claim analysis.
+# Everything else in the REST response is dropped right after decoding.
+TRUST_SCORE_USER_FIELDS = ('created_at', 'followers', 'following', 'public_repos')
+CLAIM_COMMENT_FIELDS = ('user', 'body', 'created_at')
+
+# Shared stand-in for a missing nested object; never mutated
+_EMPTY: Dict = {}
+
+# Claim phrases with shared prefixes factored out. With the `regex` module the
+# alternation is wrapped in an atomic group so a failed branch never backtracks.
+_CLAIM_ALTERNATION = (
+    r"i'?ll\s+(?:work\s+on|take|fix)\s+this"
+    r"|can\s+i\s+(?:work\s+on|take)\s+this"
+    r"|assigning\s+myself"
+    r"|i'?m\s+on\s+it"
+    r"|working\s+on\s+it"
+    r"|let\s+me\s+handle\s+this"
+)
+if _regex is not None:
+    CLAIMING_REGEX = _regex.compile(rf"(?i)(?>{_CLAIM_ALTERNATION})")
+else:
+    CLAIMING_REGEX = re.compile(rf"(?:{_CLAIM_ALTERNATION})", re.IGNORECASE)
+
+# Claim patterns reported by detect_claiming_patterns (case-insensitive).
+# With hyperscan all of them are matched in one pass over the comment.
+CLAIMING_PATTERNS = (
+    r'\b(i\'ll take this|taking this|i can do this|let me handle|working on this)\b',
+    r'\b(assigning? (this )?to myself|self[- ]assign)\b',
+    r'\b(i\'m on it|got it|i\'ll fix)\b',
+    r'\b(claiming|claim)\b',
+    r'@\w+\s+(can i|may i|could i).*(take|work on|handle)',
+    r'\b(i will|i\'ll)\s+(work on|fix|handle|take care of)\b',
+)
+_CLAIMING_PATTERN_REGEXES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in CLAIMING_PATTERNS)
+if hyperscan is not None:
+    _CLAIMING_PATTERN_DB = hyperscan.Database()
+    _CLAIMING_PATTERN_DB.compile(
+        expressions=[pattern.encode() for pattern in CLAIMING_PATTERNS],
+        ids=list(range(len(CLAIMING_PATTERNS))),
+        elements=len(CLAIMING_PATTERNS),
+        flags=[
+            hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+            | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+        ] * len(CLAIMING_PATTERNS),
+    )
+else:
+    _CLAIMING_PATTERN_DB = None
+# A database owns a single scratch space, so scans must not overlap
+_CLAIMING_PATTERN_DB_LOCK = threading.Lock()
+
+# The same claim phrases as literals, matched against a comment that has been
+# lowercased, stripped of apostrophes and whitespace-collapsed
+CLAIM_LITERALS = (
+    'ill work on this', 'ill take this', 'ill fix this',
+    'can i work on this', 'can i take this',
+    'assigning myself', 'im on it', 'working on it', 'let me handle this',
+)
+if ahocorasick is not None:
+    _CLAIM_AUTOMATON = ahocorasick.Automaton()
+    for _phrase in CLAIM_LITERALS:
+        _CLAIM_AUTOMATON.add_word(_phrase, _phrase)
+    _CLAIM_AUTOMATON.make_automaton()
+else:
+    _CLAIM_AUTOMATON = None
+
+# One page of issues with their comments, replacing the per-issue REST fan-out
+REPO_ISSUES_WITH_COMMENTS_QUERY = """
+query($owner: String!, $name: String!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    issues(first: 100, after: $cursor) {
+      pageInfo { endCursor hasNextPage }
+      nodes {
+        number title url state
+        comments(first: 100) {
+          nodes { author { login } bodyText createdAt }
+        }
+      }
+    }
+  }
+}
+"""
+
+# Profile fields of one user, in place of GET /users/{login}
+USER_BUNDLE_QUERY = """
+query($login: String!) {
+  user(login: $login) {
+    databaseId login name company location email bio createdAt updatedAt
+    followers { totalCount }
+    following { totalCount }
+    repositories(privacy: PUBLIC, ownerAffiliations: OWNER) { totalCount }
+  }
+}
+"""
+
+# Comment fields requested for each issue in a batched per-issue query
+ISSUE_COMMENTS_FRAGMENT = """
+fragment IssueComments on Issue {
+  comments(last: 100) {
+    totalCount
+    nodes { author { login } bodyText createdAt }
+  }
+}
+"""
+
+# rel="next" target of a raw Link header, for responses requests didn't parse
+_NEXT_LINK_RE = re.compile(r'<([^<>]+)>;\s*rel="next"')
+
+# Per-user inputs of the trust score, packed for vectorized scoring
+TRUST_FACTORS_DTYPE = np.dtype([
+    ('followers', np.float64),
+    ('following', np.float64),
+    ('public_repos', np.float64),
+    ('account_age_days', np.float64),
+    ('event_count', np.float64),
+    ('event_type_count', np.float64),
+])
+
 
 class GitHubAPIService:
     """Service for interacting with GitHub API to detect cookie-licking behavior"""
     
+    # Remaining-request budget below which we wait for the rate limit window to reset
+    RATE_LIMIT_THRESHOLD = 10
+    # Upper bound (seconds) on how long a single call may block waiting on the rate limit
+    MAX_RATE_LIMIT_WAIT = 60
+    # (connect, read) timeouts, in seconds, of every request to GitHub
+    REQUEST_TIMEOUT = (3.05, 15)
+    # Lifetimes (seconds) of cached response bodies, tiered by how quickly the
+    # underlying data changes; ETag validators outlive them for revalidation
+    SHARED_CACHE_TTL = 300
+    USER_DETAILS_TTL = 600
+    EVENTS_TTL = 60
+    COMMENTS_TTL = 30
+    SHARED_ETAG_TTL = 86400
+    
     def __init__(self, token: str = None, base_url: str = None):
         """
         Initialize GitHub API service
@@ -23,10 +186,35 @@ class GitHubAPIService:
             token: GitHub personal access token for authenticated requests
             base_url: GitHub API base URL
         """
-        self.token = token or getattr(settings, 'GITHUB_API_TOKEN', None)
+        self.token = (
+            token
+            or getattr(settings, 'GITHUB_API_TOKEN', None)
+            or getattr(settings, 'GITHUB_ACCESS_TOKEN', None)
+        )
         self.base_url = (base_url or getattr(settings, 'GITHUB_API_BASE_URL', 'https://api.github.com')).rstrip('/')
         self.session = requests.Session()
         
+        # Keep connections to the API warm across a repository scan and retry
+        # transient failures with backoff; rate-limit 403s are still handled in _request
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"],
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=retry)
+        self.session.mount("https://", adapter)
+        
+        # (body, ttl) of decoded GET responses keyed on URL + query params, so
+        # repeated lookups are served from memory until their own TTL runs out
+        self._cache = TLRUCache(maxsize=4096, ttu=lambda key, value, now: now + value[1])
+        self._cache_lock = threading.Lock()
+        # (ETag, body) per key, kept past the TTL so expired entries can be
+        # revalidated with If-None-Match; a 304 does not count against the rate limit
+        self._etag_cache = LRUCache(maxsize=4096)
+        
         # Set up authentication headers
         if self.token:
             self.session.headers.update({
@@ -38,63 +226,353 @@ class GitHubAPIService:
                 'Accept': 'application/vnd.github.v3+json'
             })
 
-    def get_user_details(self, username: str) -> Optional[Dict]:
-        """Fetch GitHub user details"""
+    def _request(self, url: str, params: Optional[Dict] = None,
+                 headers: Optional[Dict] = None) -> requests.Response:
+        """GET a GitHub API URL, throttling on the X-RateLimit-* response headers"""
+        response = self.session.get(url, params=params, headers=headers, timeout=self.REQUEST_TIMEOUT)
+        
+        rate_limited = response.status_code == 429 or (
+            response.status_code == 403 and (
+                response.headers.get('X-RateLimit-Remaining') == '0'
+                or 'Retry-After' in response.headers
+            )
+        )
+        
+        if rate_limited:
+            self._wait_for_rate_limit(response)
+            response = self.session.get(url, params=params, headers=headers, timeout=self.REQUEST_TIMEOUT)
+        else:
+            remaining = response.headers.get('X-RateLimit-Remaining', '')
+            if remaining.isdigit() and int(remaining) < self.RATE_LIMIT_THRESHOLD:
+                self._wait_for_rate_limit(response)
+        
+        response.raise_for_status()
+        return response
+
+    def _wait_for_rate_limit(self, response: requests.Response) -> None:
+        """Sleep until GitHub says more requests are allowed (Retry-After, then X-RateLimit-Reset)"""
+        retry_after = response.headers.get('Retry-After', '')
+        reset = response.headers.get('X-RateLimit-Reset', '')
+        
+        if retry_after.isdigit():
+            delay = int(retry_after)
+        elif reset.isdigit():
+            delay = int(reset) - time.time()
+        else:
+            return
+        
+        delay = min(self.MAX_RATE_LIMIT_WAIT, max(0, delay))
+        if delay:
+            logger.warning("GitHub rate limit reached, waiting %.0fs", delay)
+            time.sleep(delay)
+
+    def _get_json(self, url: str, params: Optional[Dict] = None, ttl: Optional[int] = None) -> Any:
+        """
+        GET a GitHub API URL and return the decoded body
+        
+        Lookups go through the in-process TTL cache, then the Redis cache shared
+        by all workers (when REDIS_URL is set), then a conditional request
+        revalidating the last known ETag. If GitHub is unreachable, times out
+        or answers 5xx, the last known body is served stale instead of raising.
+        """
+        key = (url, tuple(sorted((params or {}).items())))
+        ttl = ttl or self.SHARED_CACHE_TTL
+        
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            validator = self._etag_cache.get(key)
+        if cached is not None:
+            return cached[0]
+        
+        shared = get_redis()
+        redis_key = 'gh:' + hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+        if shared is not None:
+            try:
+                raw_body, raw_validator = shared.mget(redis_key, redis_key + ':etag')
+            except RedisError as e:
+                logger.warning("Shared GitHub cache unavailable: %s", e)
+                shared = None
+            else:
+                if raw_body is not None:
+                    data = json_loads(raw_body)
+                    with self._cache_lock:
+                        self._cache[key] = (data, ttl)
+                    return data
+                if validator is None and raw_validator is not None:
+                    validator = tuple(json_loads(raw_validator))
+        
+        headers = {'If-None-Match': validator[0]} if validator else None
+        try:
+            response = self._request(url, params, headers)
+        except requests.RequestException as e:
+            # Only an unreachable or failing GitHub is papered over; 4xx answers
+            # (deleted resource, revoked token) must reach the caller
+            upstream_error = isinstance(e, (requests.ConnectionError, requests.Timeout)) or (
+                e.response is not None and e.response.status_code >= 500
+            )
+            if not validator or not upstream_error:
+                raise
+            logger.warning("GitHub request for %s failed, serving stale response: %s", url, e)
+            return validator[1]
+        
+        if response.status_code == 304 and validator:
+            data = validator[1]
+        else:
+            data = json_loads(response.content)
+        
+        etag = response.headers.get('ETag')
+        fresh_validator = etag and response.status_code != 304
+        with self._cache_lock:
+            self._cache[key] = (data, ttl)
+            if fresh_validator:
+                self._etag_cache[key] = (etag, data)
+        
+        if shared is not None:
+            try:
+                with shared.pipeline() as pipe:
+                    pipe.set(redis_key, json_dumps(data), ex=ttl)
+                    if fresh_validator:
+                        pipe.set(redis_key + ':etag', json_dumps([etag, data]), ex=self.SHARED_ETAG_TTL)
+                    pipe.execute()
+            except RedisError as e:
+                logger.warning("Could not write to shared GitHub cache: %s", e)
+        return data
+
+    @staticmethod
+    def _project(data: Dict, fields: Tuple[str, ...]) -> Dict:
+        """Keep only the requested keys of a decoded GitHub object"""
+        projected = {key: data[key] for key in fields if key in data}
+        
+        # Nested user objects are only ever read for their login
+        if isinstance(projected.get('user'), dict):
+            projected['user'] = {'login': projected['user'].get('login', '')}
+            
+        return projected
+
+    def get_user_details(self, username: str, fields: Optional[Tuple[str, ...]] = None) -> Optional[Dict]:
+        """Fetch GitHub user details, optionally projected down to `fields`"""
         url = f"{self.base_url}/users/{username}"
         
         try:
-            response = self.session.get(url)
-            response.raise_for_status()
-            return response.json()
+            user = self._get_json(url, ttl=self.USER_DETAILS_TTL)
+            return self._project(user, fields) if fields else user
         except requests.RequestException as e:
-            logger.error(f"Error fetching user details for {username}: {e}")
+            logger.error("Error fetching user details for %s: %s", username, e)
             return None
     
+    def _get_user_details_graphql(self, username: str) -> Optional[Dict]:
+        """User details via GraphQL, keyed like the REST user object; None if unavailable"""
+        key = ('graphql:user', username.lower())
+        with self._cache_lock:
+            cached = self._cache.get(key)
+        if cached is not None:
+            return cached[0]
+        
+        try:
+            data = self.graphql(USER_BUNDLE_QUERY, {'login': username})
+        except requests.RequestException as e:
+            logger.error("Error fetching user %s via GraphQL: %s", username, e)
+            return None
+        node = (data or _EMPTY).get('user')
+        if not node:
+            return None
+        
+        user = {
+            'id': node['databaseId'],
+            'login': node['login'],
+            'name': node['name'],
+            'company': node['company'],
+            'location': node['location'],
+            'email': node['email'] or None,
+            'bio': node['bio'],
+            'public_repos': node['repositories']['totalCount'],
+            'followers': node['followers']['totalCount'],
+            'following': node['following']['totalCount'],
+            'created_at': node['createdAt'],
+            'updated_at': node['updatedAt'],
+        }
+        with self._cache_lock:
+            self._cache[key] = (user, self.USER_DETAILS_TTL)
+        return user
+
+    def fetch_user_bundle(self, username: str, event_pages: int = 2) -> Optional[Dict]:
+        """
+        Fetch a user's details and recent public events together
+        
+        Details come from one GraphQL query when a token is configured (REST
+        otherwise) while the events, which have no GraphQL equivalent, are
+        fetched concurrently. Returns {'user': ..., 'events': [...]}, or None
+        when the user does not exist.
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            events = executor.submit(self.get_user_events, username, event_pages)
+            user = self._get_user_details_graphql(username) if self.token else None
+            if user is None:
+                user = self.get_user_details(username)
+            
+            if not user:
+                return None
+            return {'user': user, 'events': events.result()}
+
     def get_repo_issues_comments(self, owner: str, repo: str) -> List[Dict]:
         """Fetch all comments from repository issues"""
         url = f"{self.base_url}/repos/{owner}/{repo}/issues/comments"
         
         try:
-            response = self.session.get(url)
-            response.raise_for_status()
-            return response.json()
+            return self._get_json(url)
         except requests.RequestException as e:
-            logger.error(f"Error fetching repo comments: {e}")
+            logger.error("Error fetching repo comments: %s", e)
             return []
 
-    def get_user_events(self, username: str, pages: int = 1) -> List[Dict]:
-        """Fetch user's public events with pagination"""
-        all_events = []
+    def graphql(self, query: str, variables: Optional[Dict] = None) -> Optional[Dict]:
+        """Run a GitHub GraphQL query and return its data, or None on errors"""
+        response = self.session.post(
+            f"{self.base_url}/graphql",
+            json={'query': query, 'variables': variables or {}},
+            timeout=self.REQUEST_TIMEOUT
+        )
+        response.raise_for_status()
+        body = json_loads(response.content)
         
-        for page in range(1, pages + 1):
-            url = f"{self.base_url}/users/{username}/events/public"
-            params = {'page': page, 'per_page': 30}
+        if body.get('errors'):
+            logger.error("GraphQL query failed: %s", body['errors'])
+            return None
+        return body.get('data')
+
+    @staticmethod
+    def _graphql_comment(node: Dict) -> Dict:
+        """A GraphQL comment node in the CLAIM_COMMENT_FIELDS shape of a REST comment"""
+        return {
+            'user': {'login': (node.get('author') or _EMPTY).get('login', '')},
+            'body': node.get('bodyText', ''),
+            'created_at': node.get('createdAt', ''),
+        }
+
+    def graphql_batch_issues(self, issues: List[Tuple[str, str, int]]) -> Optional[Dict[Tuple[str, str, int], Dict]]:
+        """
+        Fetch the comments of many issues, across repositories, in one GraphQL request
+        
+        Returns {(owner, repo, number): {'comments': [...], 'total_comments': n}}
+        with comments in CLAIM_COMMENT_FIELDS shape. Issues GitHub could not
+        resolve are left out. Returns None when GraphQL is unavailable (no
+        token) or fails, so callers can fall back to REST.
+        """
+        if not self.token or not issues:
+            return None
+        
+        declarations = []
+        selections = []
+        variables = {}
+        for i, (owner, repo, number) in enumerate(issues):
+            declarations.append(f'$o{i}: String!, $r{i}: String!, $n{i}: Int!')
+            selections.append(
+                f'i{i}: repository(owner: $o{i}, name: $r{i}) {{ issue(number: $n{i}) {{ ...IssueComments }} }}'
+            )
+            variables.update({f'o{i}': owner, f'r{i}': repo, f'n{i}': number})
+        
+        query = (
+            f"query({', '.join(declarations)}) {{\n  " + '\n  '.join(selections) + '\n}\n'
+            + ISSUE_COMMENTS_FRAGMENT
+        )
+        
+        try:
+            data = self.graphql(query, variables)
+            if data is None:
+                return None
             
-            try:
-                response = self.session.get(url, params=params)
-                response.raise_for_status()
-                events = response.json()
+            results = {}
+            for i, key in enumerate(issues):
+                issue = (data.get(f'i{i}') or _EMPTY).get('issue')
+                if issue:
+                    results[key] = {
+                        'comments': [self._graphql_comment(c) for c in issue['comments']['nodes']],
+                        'total_comments': issue['comments']['totalCount'],
+                    }
+            return results
+        except (requests.RequestException, KeyError, TypeError) as e:
+            logger.error("Error batch-fetching %d issues via GraphQL: %s", len(issues), e)
+            return None
+
+    def get_repo_issues_with_comments(self, owner: str, repo: str) -> Optional[List[Dict]]:
+        """
+        Fetch every issue of a repository together with its comments via GraphQL
+        
+        Issues use the REST field names (number, title, html_url, state) and
+        carry their comments, in CLAIM_COMMENT_FIELDS shape, under
+        'issue_comments'. Returns None when GraphQL is unavailable (no token)
+        or fails, so callers can fall back to REST.
+        """
+        if not self.token:
+            return None
+        
+        issues = []
+        cursor = None
+        try:
+            while True:
+                data = self.graphql(
+                    REPO_ISSUES_WITH_COMMENTS_QUERY,
+                    {'owner': owner, 'name': repo, 'cursor': cursor}
+                )
+                if not data or not data.get('repository'):
+                    return None
                 
-                if not events:  # No more events
-                    break
-                    
-                all_events.extend(events)
+                page = data['repository']['issues']
+                for node in page['nodes']:
+                    issues.append({
+                        'number': node['number'],
+                        'title': node['title'],
+                        'html_url': node['url'],
+                        'state': node['state'].lower(),
+                        'issue_comments': [
+                            self._graphql_comment(comment) for comment in node['comments']['nodes']
+                        ],
+                    })
+                
+                if not page['pageInfo']['hasNextPage']:
+                    return issues
+                cursor = page['pageInfo']['endCursor']
+        except (requests.RequestException, KeyError, TypeError) as e:
+            logger.error("Error fetching issues for %s/%s via GraphQL: %s", owner, repo, e)
+            return None
+
+    def get_user_events(self, username: str, pages: int = 1) -> List[Dict]:
+        """Fetch user's public events, requesting all pages concurrently"""
+        url = f"{self.base_url}/users/{username}/events/public"
+        
+        def fetch(page: int) -> Optional[List[Dict]]:
+            try:
+                return self._get_json(url, {'page': page, 'per_page': 30}, ttl=self.EVENTS_TTL)
             except requests.RequestException as e:
-                logger.error(f"Error fetching user events page {page}: {e}")
+                logger.error("Error fetching user events page %d: %s", page, e)
+                return None
+        
+        if pages <= 1:
+            results = [fetch(1)]
+        else:
+            with ThreadPoolExecutor(max_workers=pages) as executor:
+                results = list(executor.map(fetch, range(1, pages + 1)))
+        
+        # Keep pages in order up to the first empty or failed one
+        all_events = []
+        for events in results:
+            if not events:
                 break
+            all_events.extend(events)
                 
         return all_events
 
-    def get_issue_comments(self, owner: str, repo: str, issue_number: int) -> List[Dict]:
-        """Fetch comments for a specific issue"""
+    def get_issue_comments(self, owner: str, repo: str, issue_number: int,
+                           fields: Optional[Tuple[str, ...]] = None) -> List[Dict]:
+        """Fetch comments for a specific issue, optionally projected down to `fields`"""
         url = f"{self.base_url}/repos/{owner}/{repo}/issues/{issue_number}/comments"
         
         try:
-            response = self.session.get(url)
-            response.raise_for_status()
-            return response.json()
+            comments = self._get_json(url, ttl=self.COMMENTS_TTL)
+            if fields:
+                comments = [self._project(comment, fields) for comment in comments]
+            return comments
         except requests.RequestException as e:
-            logger.error(f"Error fetching issue comments: {e}")
+            logger.error("Error fetching issue comments: %s", e)
             return []
 
     def search_user_comments(self, username: str) -> List[Dict]:
@@ -106,29 +584,82 @@ class GitHubAPIService:
             'per_page': 100
         }
         
+        results = []
         try:
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            return response.json().get('items', [])
+            for item in self._paginate(url, params, items_key='items'):
+                results.append(item)
         except requests.RequestException as e:
-            logger.error(f"Error searching user comments: {e}")
-            return []
+            logger.error("Error searching user comments: %s", e)
+            
+        return results
 
-    def get_repo_commits(self, owner: str, repo: str, since: Optional[str] = None) -> List[Dict]:
-        """Fetch repository commits"""
+    @staticmethod
+    def _next_link(response: requests.Response) -> Optional[str]:
+        """Return the rel="next" URL of a paginated response, if any"""
+        next_url = response.links.get('next', {}).get('url')
+        if next_url:
+            return next_url
+        
+        match = _NEXT_LINK_RE.search(response.headers.get('Link', ''))
+        return match.group(1) if match else None
+
+    def _paginate(self, url: str, params: Optional[Dict] = None,
+                  items_key: Optional[str] = None) -> Iterator[Dict]:
+        """
+        Yield items from every page of a list endpoint, following the Link header
+        
+        items_key names the list inside an object body (e.g. 'items' for search).
+        """
+        while url:
+            response = self._request(url, params)
+            body = json_loads(response.content)
+            yield from (body.get(items_key, []) if items_key else body)
+            
+            # The next-page URL already carries the full query string
+            url = self._next_link(response)
+            params = None
+
+    def iter_repo_commits(self, owner: str, repo: str, since: Optional[str] = None) -> Iterator[Dict]:
+        """Stream repository commits page by page"""
         url = f"{self.base_url}/repos/{owner}/{repo}/commits"
-        params = {}
+        params = {'per_page': 100}
         
         if since:
             params['since'] = since
             
         try:
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
+            yield from self._paginate(url, params)
         except requests.RequestException as e:
-            logger.error(f"Error fetching repo commits: {e}")
-            return []
+            logger.error("Error fetching repo commits: %s", e)
+
+    def get_repo_commits(self, owner: str, repo: str, since: Optional[str] = None) -> List[Dict]:
+        """Fetch repository commits (deprecated: use iter_repo_commits)"""
+        logger.warning("get_repo_commits is deprecated, use iter_repo_commits instead")
+        return list(self.iter_repo_commits(owner, repo, since))
+
+
+@dataclass(slots=True)
+class IssueAnalysis:
+    """A user's interaction with one issue, as computed by the behavior analysis"""
+    issue_number: int
+    issue_title: str
+    issue_url: str
+    claimed: bool = False
+    claim_date: Optional[str] = None
+    completed: bool = False
+    abandoned: bool = False
+    days_since_claim: int = 0
+    follow_up_comments: int = 0
+    technical_comments: int = 0
+    user_comments: int = 0
+
+
+def user_analysis_to_dict(analysis: Dict) -> Dict:
+    """Copy of a user analysis with its IssueAnalysis lists turned into plain dicts"""
+    serialized = dict(analysis)
+    for key in ('claimed_issues', 'completed_issues', 'abandoned_issues'):
+        serialized[key] = [asdict(issue) for issue in analysis[key]]
+    return serialized
 
 
 class CookieLickingDetector:
@@ -141,35 +672,60 @@ class CookieLickingDetector:
         self.github_service = github_service
         
         # Patterns that indicate claiming behavior
-        self.claiming_patterns = [
-            r'\b(i\'ll take this|taking this|i can do this|let me handle|working on this)\b',
-            r'\b(assigning? (this )?to myself|self[- ]assign)\b',
-            r'\b(i\'m on it|got it|i\'ll fix)\b',
-            r'\b(claiming|claim)\b',
-            r'@\w+\s+(can i|may i|could i).*(take|work on|handle)',
-            r'\b(i will|i\'ll)\s+(work on|fix|handle|take care of)\b'
-        ]
+        self.claiming_patterns = list(CLAIMING_PATTERNS)
+        
+        # Claim phrases used for the per-user behavior analysis
+        self.claiming_regex = CLAIMING_REGEX
         
         # Time thresholds (in days)
         self.inactive_threshold = 7  # Days without activity after claiming
         self.abandonment_threshold = 14  # Days considered abandoned
         
+        # Upper bound on concurrent GitHub requests issued by one analysis
+        self.max_workers = 16
+        
+        # Finished per-user analyses keyed on (username, owner, repo), reused
+        # across repository scans for an hour
+        self._analysis_cache = TTLCache(maxsize=1024, ttl=3600)
+        self._analysis_cache_lock = threading.Lock()
+        
     def detect_claiming_patterns(self, comment_body: str) -> List[str]:
         """Detect claiming patterns in comment text"""
-        found_patterns = []
-        comment_lower = comment_body.lower()
+        if _CLAIMING_PATTERN_DB is None:
+            return [regex.pattern for regex in _CLAIMING_PATTERN_REGEXES if regex.search(comment_body)]
         
-        for pattern in self.claiming_patterns:
-            if re.search(pattern, comment_lower, re.IGNORECASE):
-                found_patterns.append(pattern)
-                
-        return found_patterns
+        matched = set()
+        with _CLAIMING_PATTERN_DB_LOCK:
+            _CLAIMING_PATTERN_DB.scan(
+                comment_body.encode(),
+                match_event_handler=lambda pattern_id, *_: matched.add(pattern_id)
+            )
+        return [CLAIMING_PATTERNS[pattern_id] for pattern_id in sorted(matched)]
+
+    def detect_claiming_comment(self, comment_body: str) -> bool:
+        """Check if a comment indicates the user is claiming an issue"""
+        if _CLAIM_AUTOMATON is None:
+            return bool(self.claiming_regex.search(comment_body))
+        
+        # Single linear pass over the normalized body for all phrases at once
+        body = ' '.join(comment_body.lower().replace("'", '').replace('`', '').split())
+        return next(_CLAIM_AUTOMATON.iter(body), None) is not None
 
-    def analyze_issue_for_cookie_licking(self, owner: str, repo: str, issue_number: int, assignee: str) -> Dict:
-        """Analyze a specific issue for cookie-licking behavior"""
+    def analyze_issue_for_cookie_licking(self, owner: str, repo: str, issue_number: int, assignee: str,
+                                         comments: Optional[List[Dict]] = None) -> Dict:
+        """
+        Analyze a specific issue for cookie-licking behavior
+        
+        Pass `comments` (CLAIM_COMMENT_FIELDS shape) when they were already
+        fetched, e.g. by graphql_batch_issues, to skip the REST lookup. On
+        success the comments analyzed are returned under 'comments'.
+        """
         try:
             # Get issue comments
-            comments = self.github_service.get_issue_comments(owner, repo, issue_number)
+            if comments is None:
+                comments = self.github_service.get_issue_comments(
+                    owner, repo, issue_number, fields=CLAIM_COMMENT_FIELDS
+                )
             
             if not comments:
                 return {
@@ -178,22 +734,23 @@ class CookieLickingDetector:
                 }
             
             # Find claiming comments by assignee
-            claiming_comments = []
+            patterns_detected = []
+            claiming_count = 0
             assignee_comments = []
+            assignee_lc = assignee.lower()
             
             for comment in comments:
-                if comment.get('user', {}).get('login', '').lower() == assignee.lower():
+                user = comment.get('user') or _EMPTY
+                login = user.get('login', '')
+                if login.lower() == assignee_lc:
                     assignee_comments.append(comment)
                     
                     # Check for claiming patterns
                     body = comment.get('body', '')
                     patterns = self.detect_claiming_patterns(body)
                     if patterns:
-                        claiming_comments.append({
-                            'comment': comment,
-                            'patterns': patterns,
-                            'created_at': comment.get('created_at')
-                        })
+                        patterns_detected.append(patterns)
+                        claiming_count += 1
             
             # Analyze activity timeline
             last_activity = None
@@ -206,23 +763,24 @@ class CookieLickingDetector:
             if last_activity:
                 try:
                     last_date = datetime.fromisoformat(last_activity.replace('Z', '+00:00'))
+                except ValueError:
+                    last_date = None
+                if last_date:
                     days_inactive = (datetime.now(last_date.tzinfo) - last_date).days
-                except:
-                    days_inactive = 0
             
             # Determine risk level
             risk_level = 'low'
             risk_factors = []
             
-            if claiming_comments and days_inactive > self.inactive_threshold:
+            if claiming_count and days_inactive > self.inactive_threshold:
                 risk_level = 'medium'
                 risk_factors.append(f'Claimed issue but inactive for {days_inactive} days')
             
-            if claiming_comments and days_inactive > self.abandonment_threshold:
+            if claiming_count and days_inactive > self.abandonment_threshold:
                 risk_level = 'high'
                 risk_factors.append(f'Potential abandonment - {days_inactive} days inactive')
             
-            if len(claiming_comments) > 1:
+            if claiming_count > 1:
                 risk_factors.append('Multiple claiming comments')
             
             # Generate recommendation
@@ -235,28 +793,39 @@ class CookieLickingDetector:
             return {
                 'success': True,
                 'risk_level': risk_level,
-                'patterns_detected': [c['patterns'] for c in claiming_comments],
+                'patterns_detected': patterns_detected,
                 'days_since_assignment': days_inactive,
                 'last_activity': last_activity,
                 'assignee_trust_score': self.calculate_trust_score(assignee).get('trust_score', 50),
                 'recommendation': recommendation,
                 'risk_factors': risk_factors,
-                'claiming_comments_count': len(claiming_comments),
-                'total_comments_by_assignee': len(assignee_comments)
+                'claiming_comments_count': claiming_count,
+                'total_comments_by_assignee': len(assignee_comments),
+                'comments': comments
             }
             
-        except Exception as e:
-            logger.error(f"Error analyzing issue {owner}/{repo}#{issue_number}: {e}")
+        except (KeyError, TypeError, ValueError) as e:
+            logger.error("Error analyzing issue %s/%s#%s: %s", owner, repo, issue_number, e)
             return {
                 'success': False,
                 'error': str(e)
             }
 
-    def calculate_trust_score(self, username: str) -> Dict:
-        """Calculate trust score for a contributor based on their GitHub activity"""
+    def calculate_trust_score(self, username: str, bundle: Optional[Dict] = None) -> Dict:
+        """
+        Calculate trust score for a contributor based on their GitHub activity
+        
+        Pass the result of GitHubAPIService.fetch_user_bundle as `bundle` to
+        score already-fetched data instead of fetching it again.
+        """
         try:
             # Get user details
-            user_details = self.github_service.get_user_details(username)
+            if bundle is not None:
+                user_details = bundle['user']
+            else:
+                user_details = self.github_service.get_user_details(
+                    username, fields=TRUST_SCORE_USER_FIELDS
+                )
             if not user_details:
                 return {
                     'success': False,
@@ -264,18 +833,26 @@ class CookieLickingDetector:
                 }
             
             # Get recent activity
-            events = self.github_service.get_user_events(username, pages=2)
+            if bundle is not None:
+                events = bundle['events']
+            else:
+                events = self.github_service.get_user_events(username, pages=2)
             
             # Base score calculation
             base_score = 50
             
             # Account age factor (older accounts are more trustworthy)
-            try:
-                created_date = datetime.fromisoformat(user_details.get('created_at', '').replace('Z', '+00:00'))
-                account_age_days = (datetime.now(created_date.tzinfo) - created_date).days
-                age_score = min(25, account_age_days / 365 * 10)  # Max 25 points for account age
-            except:
-                age_score = 0
+            account_age_days = 0
+            age_score = 0
+            created_at = user_details.get('created_at')
+            if created_at:
+                try:
+                    created_date = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
+                except ValueError:
+                    created_date = None
+                if created_date:
+                    account_age_days = (datetime.now(created_date.tzinfo) - created_date).days
+                    age_score = min(25, account_age_days / 365 * 10)  # Max 25 points for account age
             
             # Follower/following ratio (more followers relative to following is better)
             followers = user_details.get('followers', 0)
@@ -293,7 +870,7 @@ class CookieLickingDetector:
             activity_score = min(20, len(events) * 0.5)
             
             # Event type diversity (different types of contributions)
-            event_types = set([event.get('type') for event in events])
+            event_types = {event.get('type') for event in events}
             diversity_score = len(event_types) * 2
             
             # Calculate final score
@@ -304,7 +881,7 @@ class CookieLickingDetector:
                 'success': True,
                 'trust_score': round(trust_score, 2),
                 'factors': {
-                    'account_age_days': account_age_days if 'account_age_days' in locals() else 0,
+                    'account_age_days': account_age_days,
                     'followers': followers,
                     'following': following,
                     'public_repos': user_details.get('public_repos', 0),
@@ -313,34 +890,414 @@ class CookieLickingDetector:
                 }
             }
             
-        except Exception as e:
-            logger.error(f"Error calculating trust score for {username}: {e}")
+        except (KeyError, TypeError, ValueError) as e:
+            logger.error("Error calculating trust score for %s: %s", username, e)
             return {
                 'success': False,
                 'error': str(e)
             }
 
+    def batch_calculate_trust_scores(self, usernames: List[str]) -> Tuple[np.ndarray, List[Optional[Dict]]]:
+        """
+        Calculate trust scores for many contributors at once
+        
+        Uses the same factors as calculate_trust_score, computed over NumPy
+        arrays. Returns the scores and each user's factors in the shape of
+        calculate_trust_score's 'factors'; users whose details could not be
+        fetched score NaN and have no factors.
+        """
+        def fetch(username: str) -> Tuple[Optional[Dict], List[Dict]]:
+            user_details = self.github_service.get_user_details(
+                username, fields=TRUST_SCORE_USER_FIELDS
+            )
+            if not user_details:
+                return None, []
+            return user_details, self.github_service.get_user_events(username, pages=2)
+        
+        if not usernames:
+            return np.empty(0, dtype=np.float64), []
+        
+        with ThreadPoolExecutor(max_workers=min(16, len(usernames))) as executor:
+            fetched = list(executor.map(fetch, usernames))
+        
+        factors = np.zeros(len(usernames), dtype=TRUST_FACTORS_DTYPE)
+        found = np.zeros(len(usernames), dtype=bool)
+        user_factors: List[Optional[Dict]] = [None] * len(usernames)
+        now = datetime.now(timezone.utc)
+        
+        for i, (user_details, events) in enumerate(fetched):
+            if not user_details:
+                continue
+            found[i] = True
+            
+            account_age_days = 0
+            created_at = user_details.get('created_at')
+            if created_at:
+                try:
+                    created_date = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
+                    account_age_days = (now - created_date).days
+                except ValueError:
+                    pass
+            
+            event_types = list({event.get('type') for event in events})
+            user_factors[i] = {
+                'account_age_days': account_age_days,
+                'followers': user_details.get('followers', 0),
+                'following': user_details.get('following', 0),
+                'public_repos': user_details.get('public_repos', 0),
+                'recent_events': len(events),
+                'event_types': event_types
+            }
+            factors[i] = (
+                user_factors[i]['followers'],
+                user_factors[i]['following'],
+                user_factors[i]['public_repos'],
+                account_age_days,
+                len(events),
+                len(event_types),
+            )
+        
+        followers = factors['followers']
+        following = factors['following']
+        
+        age_score = np.clip(factors['account_age_days'] / 365 * 10, 0, 25)
+        ratio_score = np.where(
+            following > 0,
+            np.minimum(15, followers / np.maximum(following, 1) * 5),
+            np.minimum(15, followers * 0.1),
+        )
+        repo_score = np.minimum(10, factors['public_repos'] * 0.5)
+        activity_score = np.minimum(20, factors['event_count'] * 0.5)
+        diversity_score = factors['event_type_count'] * 2
+        
+        trust_scores = np.clip(
+            50 + age_score + ratio_score + repo_score + activity_score + diversity_score, 0, 100
+        )
+        trust_scores = np.round(trust_scores, 2)
+        trust_scores[~found] = np.nan
+        
+        return trust_scores, user_factors
+
+    def analyze_user_behavior(self, username: str, repo_owner: str, repo_name: str,
+                              repo_issues: Optional[List[Dict]] = None) -> Dict:
+        """
+        Comprehensive analysis of a user's behavior in a repository
+        
+        repo_issues may hold the issues the user commented on, already
+        carrying their 'issue_comments'; otherwise they are looked up via search.
+        """
+        cache_key = (username, repo_owner, repo_name)
+        with self._analysis_cache_lock:
+            cached = self._analysis_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        # Get user's activity and comments
+        user_events = self.github_service.get_user_events(username)
+        
+        if repo_issues is None:
+            user_issues = self.github_service.search_user_comments(username)
+            
+            # Filter for the specific repository; repository_url ends in /repos/{owner}/{name}
+            repo_suffix = f"/repos/{repo_owner}/{repo_name}"
+            repo_issues = [
+                issue for issue in user_issues 
+                if issue.get('repository_url', '').endswith(repo_suffix)
+            ]
+        
+        analysis = {
+            'username': username,
+            'repository': f"{repo_owner}/{repo_name}",
+            'total_comments': len(repo_issues),
+            'claimed_issues': [],
+            'completed_issues': [],
+            'abandoned_issues': [],
+            'trust_score': 0.0,
+            'risk_factors': [],
+            'activity_pattern': self._analyze_activity_pattern(user_events),
+            'claiming_behavior': {},
+        }
+        
+        # Each issue needs its own comments request, so fetch them concurrently
+        now_utc = datetime.now(timezone.utc)
+        if repo_issues:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(repo_issues))) as executor:
+                issue_analyses = list(executor.map(
+                    lambda issue: self._analyze_issue_interaction(
+                        username, repo_owner, repo_name, issue, now_utc
+                    ),
+                    repo_issues
+                ))
+        else:
+            issue_analyses = []
+        
+        for issue_analysis in issue_analyses:
+            if issue_analysis.claimed:
+                analysis['claimed_issues'].append(issue_analysis)
+                
+                if issue_analysis.completed:
+                    analysis['completed_issues'].append(issue_analysis)
+                elif issue_analysis.abandoned:
+                    analysis['abandoned_issues'].append(issue_analysis)
+        
+        # Calculate trust score
+        analysis['trust_score'] = self._calculate_trust_score(analysis)
+        analysis['risk_factors'] = self._identify_risk_factors(analysis)
+        
+        with self._analysis_cache_lock:
+            self._analysis_cache[cache_key] = analysis
+        return analysis
+
+    @staticmethod
+    def _neutral_user_analysis(username: str, repo_owner: str, repo_name: str, total_comments: int) -> Dict:
+        """Analysis for a commenter who never claimed anything, built without API calls"""
+        return {
+            'username': username,
+            'repository': f"{repo_owner}/{repo_name}",
+            'total_comments': total_comments,
+            'claimed_issues': [],
+            'completed_issues': [],
+            'abandoned_issues': [],
+            'trust_score': 5.0,
+            'risk_factors': [],
+            'activity_pattern': {},
+            'claiming_behavior': {},
+        }
+
+    def _analyze_issue_interaction(self, username: str, owner: str, repo: str, issue: Dict,
+                                   now_utc: Optional[datetime] = None) -> IssueAnalysis:
+        """Analyze user's interaction with a specific issue as of now_utc (default: now)"""
+        issue_number = issue['number']
+        comments = issue.get('issue_comments')
+        if comments is None:
+            comments = self.github_service.get_issue_comments(
+                owner, repo, issue_number, fields=CLAIM_COMMENT_FIELDS
+            )
+        
+        # Logins come back with stable casing, so try an exact match before lowercasing
+        username_lc = username.lower()
+        user_comments = []
+        for comment in comments:
+            login = (comment.get('user') or _EMPTY).get('login', '')
+            if login == username or login.lower() == username_lc:
+                user_comments.append(comment)
+        
+        analysis = IssueAnalysis(
+            issue_number=issue_number,
+            issue_title=issue.get('title', ''),
+            issue_url=issue.get('html_url', ''),
+            user_comments=len(user_comments),
+        )
+        
+        # Check for claiming behavior
+        for comment in user_comments:
+            if self.detect_claiming_comment(comment.get('body') or ''):
+                analysis.claimed = True
+                analysis.claim_date = comment.get('created_at')
+                break
+        
+        if analysis.claimed and analysis.claim_date:
+            # Calculate days since claim
+            claim_date = datetime.fromisoformat(analysis.claim_date.replace('Z', '+00:00'))
+            analysis.days_since_claim = ((now_utc or datetime.now(timezone.utc)) - claim_date).days
+            
+            # Analyze follow-up activity
+            analysis.follow_up_comments = len([
+                c for c in user_comments 
+                if c.get('created_at', '') > analysis.claim_date
+            ])
+            
+            # Check if issue is closed/completed
+            analysis.completed = issue.get('state') == 'closed'
+            
+            # Consider abandoned if claimed but no activity for 7+ days and not completed
+            analysis.abandoned = (
+                analysis.days_since_claim > self.inactive_threshold and 
+                analysis.follow_up_comments == 0 and 
+                not analysis.completed
+            )
+        
+        return analysis
+
+    def _analyze_activity_pattern(self, events: List[Dict]) -> Dict:
+        """Analyze user's general GitHub activity pattern"""
+        if not events:
+            return {'total_events': 0, 'recent_activity': False, 'push_events': 0, 'issue_events': 0}
+        
+        # Recent means within 7 whole days. GitHub timestamps are ISO-8601 UTC,
+        # so they compare correctly as strings against a cutoff in the same format.
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=8)).strftime('%Y-%m-%dT%H:%M:%SZ')
+        
+        # Count different types of events
+        event_types = Counter(event.get('type', 'Unknown') for event in events)
+        recent_activity = any(event.get('created_at', '') > cutoff for event in events)
+        
+        return {
+            'total_events': len(events),
+            'event_types': dict(event_types),
+            'recent_activity': recent_activity,
+            'push_events': event_types['PushEvent'],
+            'issue_events': event_types['IssuesEvent'],
+        }
+
+    @staticmethod
+    def _claimed_issue_arrays(claimed_issues: List[IssueAnalysis]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """days_since_claim, completed and abandoned of the claimed issues as parallel arrays"""
+        n = len(claimed_issues)
+        days = np.fromiter((issue.days_since_claim for issue in claimed_issues), dtype=np.int32, count=n)
+        completed = np.fromiter((issue.completed for issue in claimed_issues), dtype=bool, count=n)
+        abandoned = np.fromiter((issue.abandoned for issue in claimed_issues), dtype=bool, count=n)
+        return days, completed, abandoned
+
+    def _calculate_trust_score(self, analysis: Dict) -> float:
+        """Calculate a 0-10 behavior score from claimed / completed / abandoned issues"""
+        if not analysis['claimed_issues']:
+            return 5.0  # Neutral score for users who don't claim issues
+        
+        _, completed, abandoned = self._claimed_issue_arrays(analysis['claimed_issues'])
+        
+        # Base score calculation
+        completion_rate = completed.mean()
+        abandonment_rate = abandoned.mean()
+        
+        # Score components (0-10 scale)
+        completion_score = completion_rate * 10
+        abandonment_penalty = abandonment_rate * 5
+        activity_bonus = 1 if analysis['activity_pattern']['recent_activity'] else 0
+        
+        # Calculate final score
+        trust_score = max(0, min(10, completion_score - abandonment_penalty + activity_bonus))
+        
+        return round(float(trust_score), 1)
+
+    def _identify_risk_factors(self, analysis: Dict) -> List[str]:
+        """Identify risk factors that suggest cookie-licking behavior"""
+        risk_factors = []
+        
+        if len(analysis['abandoned_issues']) > 2:
+            risk_factors.append("Multiple abandoned issues")
+        
+        completion_rate = 0
+        if analysis['claimed_issues']:
+            days, completed, _ = self._claimed_issue_arrays(analysis['claimed_issues'])
+            completion_rate = completed.mean()
+            
+            if days.mean() > 10:
+                risk_factors.append("Long delays after claiming issues")
+        
+        if completion_rate < 0.3:
+            risk_factors.append("Low completion rate")
+        
+        if not analysis['activity_pattern']['recent_activity']:
+            risk_factors.append("No recent GitHub activity")
+        
+        if analysis['activity_pattern']['push_events'] == 0:
+            risk_factors.append("No recent code contributions")
+        
+        return risk_factors
+
     def analyze_repository_health(self, owner: str, repo: str) -> Dict:
         """Analyze overall repository health regarding cookie-licking"""
         try:
-            # This is a placeholder for repository-level analysis
-            # In a real implementation, you'd analyze all issues, contributors, etc.
+            # Prefer one GraphQL walk over issues + comments; fall back to REST
+            issues = self.github_service.get_repo_issues_with_comments(owner, repo)
+            if issues is not None:
+                all_comments = [comment for issue in issues for comment in issue['issue_comments']]
+            else:
+                all_comments = self.github_service.get_repo_issues_comments(owner, repo)
+            
+            # Group comments by user
+            user_comments = defaultdict(list)
+            for comment in all_comments:
+                username = (comment.get('user') or _EMPTY).get('login')
+                if username:
+                    user_comments[username].append(comment)
+            
+            # Issues each user commented on, when they came with their comments
+            user_issues = None
+            if issues is not None:
+                user_issues = {username: [] for username in user_comments}
+                for issue in issues:
+                    for username in {(c.get('user') or _EMPTY).get('login') for c in issue['issue_comments']}:
+                        if username:
+                            user_issues[username].append(issue)
+            
+            # Only users with at least one claim-like comment need the full
+            # (API-backed) analysis; everyone else gets a neutral one for free
+            usernames = [
+                username for username, comments in user_comments.items()
+                if any(self.detect_claiming_comment(c.get('body') or '') for c in comments)
+            ]
+            user_analyses = {
+                username: self._neutral_user_analysis(username, owner, repo, len(comments))
+                for username, comments in user_comments.items()
+            }
+            if usernames:
+                with ThreadPoolExecutor(max_workers=min(self.max_workers, len(usernames))) as executor:
+                    results = executor.map(
+                        lambda username: self.analyze_user_behavior(
+                            username, owner, repo,
+                            user_issues[username] if user_issues is not None else None
+                        ),
+                        usernames
+                    )
+                    user_analyses.update(zip(usernames, results))
+            
+            # Repository health metrics
+            total_users = len(user_analyses)
+            high_risk_users = len([
+                user for user, analysis in user_analyses.items() 
+                if analysis['trust_score'] < 4.0
+            ])
+            
+            active_claimers = len([
+                user for user, analysis in user_analyses.items() 
+                if analysis['claimed_issues']
+            ])
+            
+            risk_percentage = (high_risk_users / total_users * 100) if total_users > 0 else 0
             
             return {
                 'success': True,
                 'repository': f"{owner}/{repo}",
-                'analysis': 'Repository analysis placeholder - would analyze all issues and contributors',
-                'health_score': 75,  # Placeholder score
-                'recommendations': [
-                    'Monitor long-running assigned issues',
-                    'Implement automated reminders for inactive assignees',
-                    'Consider contribution guidelines for issue claiming'
-                ]
+                'total_contributors': total_users,
+                'active_claimers': active_claimers,
+                'high_risk_users': high_risk_users,
+                'risk_percentage': risk_percentage,
+                'health_score': round(100 - risk_percentage, 2),
+                'user_analyses': user_analyses,
+                'recommendations': self._generate_repo_recommendations(user_analyses),
             }
             
         except Exception as e:
-            logger.error(f"Error analyzing repository {owner}/{repo}: {e}")
+            logger.error("Error analyzing repository %s/%s: %s", owner, repo, e)
             return {
                 'success': False,
                 'error': str(e)
             }
+
+    def _generate_repo_recommendations(self, user_analyses: Dict) -> List[str]:
+        """Generate recommendations for repository maintainers"""
+        recommendations = []
+        
+        high_risk_users = [
+            username for username, analysis in user_analyses.items() 
+            if analysis['trust_score'] < 4.0
+        ]
+        
+        if high_risk_users:
+            recommendations.append(
+                f"Monitor {len(high_risk_users)} high-risk contributors closely"
+            )
+        
+        abandoned_issues = sum(
+            len(analysis['abandoned_issues']) 
+            for analysis in user_analyses.values()
+        )
+        
+        if abandoned_issues > 5:
+            recommendations.append(
+                f"Review {abandoned_issues} potentially abandoned issues"
+            )
+        
+        return recommendations
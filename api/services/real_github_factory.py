@@ -0,0 +1,26 @@
+"""
+Builds the RealGitHubService used by views and background tasks
+"""
+from django.conf import settings
+
+from ..models import GoogleUser
+from .real_github_service import RealGitHubService
+
+
+def get_github_service(user_id: int = None) -> RealGitHubService:
+    """Get GitHub service with user's access token if available"""
+    if user_id:
+        try:
+            user = GoogleUser.objects.get(id=user_id)
+            return RealGitHubService(access_token=user.github_access_token)
+        except GoogleUser.DoesNotExist:
+            pass
+    
+    # Rotate across the shared token pool when one is configured
+    tokens = getattr(settings, 'GITHUB_ACCESS_TOKENS', None)
+    if tokens:
+        return RealGitHubService(tokens=tokens)
+    
+    # Use the global GitHub token from settings
+    access_token = getattr(settings, 'GITHUB_ACCESS_TOKEN', None)
+    return RealGitHubService(access_token=access_token)
@@ -3,52 +3,721 @@ Real GitHub API Service for Cookie-Licking Detection
 Uses the exact GitHub API endpoints provided by the user
 """
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+import hashlib
+import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone as dt_timezone
+from operator import itemgetter
+from typing import Any, List, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlencode, urlparse
 import logging
 from django.conf import settings
 from django.utils import timezone
 
+try:
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:  # pragma: no cover - optional accelerator
+    json_dumps, json_loads = json.dumps, json.loads
+
+from .redis_client import RedisError, get_redis
+
 logger = logging.getLogger(__name__)
 
 
+def _parse(response: requests.Response) -> Any:
+    """Decode a JSON response body (orjson when installed)"""
+    return json_loads(response.content)
+
+
+class GitHubNotReadyError(requests.RequestException):
+    """GitHub still answered 202 (data being computed) after every retry"""
+
+
+class MemoryCache:
+    """
+    Small thread-safe TTL cache with FIFO eviction
+    
+    Expired entries are kept (until evicted) together with their ETag and
+    Last-Modified validators so they can be revalidated with a conditional request.
+    """
+    
+    def __init__(self, max_size: int = 1000):
+        self.max_size = max_size
+        # key -> (data, etag, last_modified, expires_at); dicts keep insertion order
+        self._entries = {}
+        self._lock = threading.Lock()
+    
+    def get(self, key) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or time.time() > entry[3]:
+            return None
+        return entry[0]
+    
+    def get_entry(self, key) -> Optional[tuple]:
+        """Return the raw (data, etag, last_modified, expires_at) entry, even if expired"""
+        with self._lock:
+            return self._entries.get(key)
+    
+    def set(self, key, data: Any, ttl: float, etag: Optional[str] = None,
+            last_modified: Optional[str] = None) -> None:
+        """Store a value for ttl seconds, evicting the oldest entry when full"""
+        with self._lock:
+            self._entries.pop(key, None)
+            if len(self._entries) >= self.max_size:
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (data, etag, last_modified, time.time() + ttl)
+    
+    def invalidate_prefix(self, url_prefix: str) -> None:
+        """Drop every entry whose URL starts with url_prefix"""
+        with self._lock:
+            for key in [key for key in self._entries if key[1].startswith(url_prefix)]:
+                del self._entries[key]
+
+
+# Fields read from each issue comment, and the stand-in for a deleted (null) user
+_COMMENT_FIELDS = itemgetter('id', 'user', 'body', 'created_at')
+_NO_USER: Dict = {}
+
+# Issue fields read by check_inactive_contributors ('pull_request' marks PRs)
+DETECTION_ISSUE_FIELDS = ('number', 'title', 'html_url', 'assignee', 'pull_request')
+
+
+def _project(item: Dict, fields: Tuple[str, ...]) -> Dict:
+    """Keep only the requested keys of a decoded GitHub object; nested users keep just their login"""
+    projected = {key: item[key] for key in fields if key in item}
+    for key in ('user', 'assignee'):
+        if isinstance(projected.get(key), dict):
+            projected[key] = {'login': projected[key].get('login')}
+    return projected
+
+
+# GET responses shared by every RealGitHubService in the process
+_response_cache = MemoryCache(max_size=1000)
+
+# Repository part ("owner/repo") of a /repos/{owner}/{repo}/... URL
+_REPO_URL_RE = re.compile(r'/repos/([^/?#]+/[^/?#]+)')
+
+
+def _generation_key(url: str) -> Optional[str]:
+    """Redis counter bumped on every write to the repository a URL belongs to (None outside /repos/)"""
+    match = _REPO_URL_RE.search(url)
+    return f"ghreal:gen:{match.group(1).lower()}" if match else None
+
+# Open issues with their assignee and that assignee's contributions since $since
+ISSUES_WITH_ASSIGNEE_ACTIVITY_QUERY = """
+query($owner: String!, $name: String!, $since: DateTime!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    issues(first: 100, states: OPEN, after: $cursor) {
+      pageInfo { endCursor hasNextPage }
+      nodes {
+        number title url
+        assignees(first: 5) {
+          nodes {
+            login
+            contributionsCollection(from: $since) {
+              totalCommitContributions
+              totalIssueContributions
+              totalPullRequestContributions
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+# Newest issues of a repository together with their first comments
+ISSUES_WITH_COMMENTS_QUERY = """
+query($owner: String!, $name: String!, $first: Int!, $comments: Int!) {
+  repository(owner: $owner, name: $name) {
+    issues(first: $first, orderBy: {field: CREATED_AT, direction: DESC}) {
+      nodes {
+        databaseId number title body state createdAt updatedAt
+        assignees(first: 1) { nodes { login } }
+        comments(first: $comments) {
+          nodes {
+            databaseId body createdAt
+            author { login ... on User { databaseId } }
+            reactions { totalCount }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+# GitHub's secondary rate limits allow at most 100 concurrent requests; every
+# thread and service instance in the process shares these slots
+MAX_CONCURRENT_REQUESTS = 50
+_request_slots = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+
+
+# One keep-alive Session per token, shared by every RealGitHubService built for it
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def _shared_session(access_token: Optional[str], namespace: str) -> requests.Session:
+    """Return the process-wide Session for a token, creating it on first use"""
+    with _sessions_lock:
+        session = _sessions.get(namespace)
+        if session is None:
+            session = requests.Session()
+            # Large keep-alive pool for threaded fan-out; transient 5xx and 202
+            # ("still computing") responses on idempotent methods are retried
+            # here, honouring Retry-After, rate limits in _request_with_backoff
+            retry = Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=[202, 500, 502, 503, 504],
+                allowed_methods=['GET', 'PATCH'],
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            )
+            session.mount('https://', HTTPAdapter(pool_connections=64, pool_maxsize=64, max_retries=retry))
+            session.headers['Accept'] = 'application/vnd.github.v3+json'
+            if access_token:
+                session.headers['Authorization'] = f'token {access_token}'
+            _sessions[namespace] = session
+        return session
+
+
+class TokenPool:
+    """
+    Process-wide set of GitHub tokens that spreads requests over their quotas
+    
+    Each request goes out with the token that has the most requests left, as last
+    reported by its X-RateLimit-* headers, so N tokens give N times the hourly budget.
+    """
+    
+    def __init__(self, tokens: List[str]):
+        # token -> (remaining, reset epoch); (None, None) until GitHub reports it
+        self._quota = {token: (None, None) for token in tokens}
+        self._lock = threading.Lock()
+    
+    def _best(self) -> Tuple[str, Optional[int], Optional[int]]:
+        """Token with the most remaining quota; unknown or already-reset quotas count as full"""
+        now = time.time()
+        best, best_available = None, None
+        for token, (remaining, reset) in self._quota.items():
+            if remaining is None or reset is None or reset <= now:
+                return token, None, None
+            if best_available is None or remaining > best_available:
+                best, best_available = token, remaining
+        return best, best_available, self._quota[best][1]
+    
+    def acquire(self) -> str:
+        """Return the token to send the next request with"""
+        with self._lock:
+            return self._best()[0]
+    
+    def quota(self) -> Tuple[Optional[int], Optional[int]]:
+        """(remaining, reset) of the best token, or (None, None) while one has full quota"""
+        with self._lock:
+            return self._best()[1:]
+    
+    def update(self, token: str, remaining: int, reset: float) -> None:
+        """Record the quota GitHub reported (or we inferred) for a token"""
+        with self._lock:
+            self._quota[token] = (remaining, reset)
+
+
+# One TokenPool per distinct set of tokens
+_token_pools: Dict[str, TokenPool] = {}
+
+
+def _shared_token_pool(tokens: List[str], namespace: str) -> TokenPool:
+    """Return the process-wide TokenPool for a set of tokens, creating it on first use"""
+    with _sessions_lock:
+        pool = _token_pools.get(namespace)
+        if pool is None:
+            pool = _token_pools[namespace] = TokenPool(tokens)
+        return pool
+
+
 class RealGitHubService:
     """Service for real GitHub API integration using provided endpoints"""
     
-    def __init__(self, access_token: str = None):
-        """Initialize with GitHub access token for API calls"""
+    # Cache lifetimes (seconds) per endpoint
+    ISSUES_TTL = 300
+    COMMENTS_TTL = 300
+    EVENTS_TTL = 120
+    SEARCH_TTL = 600
+    COMMITS_TTL = 300
+    RATE_LIMIT_TTL = 30
+    # How long Redis keeps a response (with its ETag) for revalidation after it goes stale
+    SHARED_VALIDATOR_TTL = 86400
+    
+    # Default cap on pages fetched by _paginate, and how many are fetched at once
+    MAX_PAGES = 10
+    PAGE_WORKERS = 8
+    # Search never returns more than 1000 results
+    SEARCH_RESULT_CAP = 1000
+    
+    # (connect, read) timeouts in seconds for every GitHub request
+    REQUEST_TIMEOUT = (3.05, 15)
+    
+    # Remaining-request budget below which calls wait for the rate limit window to reset
+    RATE_LIMIT_THRESHOLD = 10
+    # Retries for rate-limited responses, and the cap (seconds) on any single wait
+    MAX_RETRIES = 5
+    MAX_BACKOFF = 60
+    
+    def __init__(self, access_token: str = None, tokens: Optional[List[str]] = None):
+        """
+        Initialize with a GitHub access token for API calls, or with a pool of
+        tokens to rotate across (a user's own access_token takes precedence)
+        """
+        tokens = [token for token in tokens or () if token]
+        pooled = not access_token and len(tokens) > 1
+        if not access_token and tokens:
+            access_token = tokens[0]
+        
         self.access_token = access_token
         self.base_url = "https://api.github.com"
-        self.session = requests.Session()
         
-        if self.access_token:
-            self.session.headers.update({
-                'Authorization': f'token {self.access_token}',
-                'Accept': 'application/vnd.github.v3+json'
-            })
+        # Last seen X-RateLimit-Remaining / X-RateLimit-Reset values
+        self.rate_limit_remaining = None
+        self.rate_limit_reset = None
+        
+        # Cached responses are partitioned per token (or token pool), since
+        # tokens can see different data
+        if pooled:
+            self._cache_namespace = 'pool:' + hashlib.sha256('\n'.join(sorted(tokens)).encode()).hexdigest()[:16]
         else:
-            self.session.headers.update({
-                'Accept': 'application/vnd.github.v3+json'
-            })
+            self._cache_namespace = (
+                hashlib.sha256(access_token.encode()).hexdigest()[:16] if access_token else 'anonymous'
+            )
+        
+        # Views build a service per request; reusing the token's Session keeps
+        # the connection to api.github.com (and its TLS session) alive between them.
+        # Pooled sessions carry no Authorization header: each request sets its own.
+        self._token_pool = _shared_token_pool(tokens, self._cache_namespace) if pooled else None
+        self.session = _shared_session(None if pooled else access_token, self._cache_namespace)
 
-    def get_repo_issues(self, owner: str, repo: str) -> List[Dict]:
+    def _request_with_backoff(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request, pacing on the X-RateLimit-* headers
+        
+        Rate-limited responses (429, or 403 with an exhausted budget / Retry-After)
+        are retried after Retry-After, the X-RateLimit-Reset time, or exponential
+        backoff with jitter. Transient 5xx and 202 responses are retried by the
+        session's adapter (GET/PATCH only); a GET still answered 202 afterwards
+        raises GitHubNotReadyError, which public methods turn into an empty result.
+        """
+        kwargs.setdefault('timeout', self.REQUEST_TIMEOUT)
+        for attempt in range(self.MAX_RETRIES + 1):
+            token = self._token_pool.acquire() if self._token_pool is not None else None
+            if token:
+                kwargs['headers'] = {**(kwargs.get('headers') or {}), 'Authorization': f'token {token}'}
+            # Only the request holds a slot, never the backoff sleeps below
+            with _request_slots:
+                response = self.session.request(method, url, **kwargs)
+            
+            remaining = response.headers.get('X-RateLimit-Remaining', '')
+            reset = response.headers.get('X-RateLimit-Reset', '')
+            if remaining.isdigit():
+                self.rate_limit_remaining = int(remaining)
+            if reset.isdigit():
+                self.rate_limit_reset = int(reset)
+                if token and remaining.isdigit():
+                    self._token_pool.update(token, int(remaining), int(reset))
+            
+            rate_limited = response.status_code == 429 or (
+                response.status_code == 403
+                and (remaining == '0' or 'Retry-After' in response.headers)
+            )
+            if not rate_limited or attempt == self.MAX_RETRIES:
+                break
+            
+            retry_after = response.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                delay = int(retry_after)
+            elif remaining == '0' and reset.isdigit():
+                # Primary limit exhausted: nothing succeeds before the window resets
+                delay = max(1, int(reset) - time.time())
+            else:
+                delay = 2 ** attempt + random.uniform(0, 1)
+            
+            if token:
+                # Bench this token until it may be used again; retry at once
+                # while another token in the pool still has quota
+                self._token_pool.update(token, 0, time.time() + delay)
+                best_remaining, _ = self._token_pool.quota()
+                if best_remaining is None or best_remaining >= self.RATE_LIMIT_THRESHOLD:
+                    continue
+            delay = min(self.MAX_BACKOFF, delay)
+            logger.warning(
+                "GitHub returned %s for %s %s, retrying in %.1fs",
+                response.status_code, method, url, delay
+            )
+            time.sleep(delay)
+        
+        # With a pool, only wait once every token is running low
+        if self._token_pool is not None:
+            self.rate_limit_remaining, self.rate_limit_reset = self._token_pool.quota()
+        
+        # Running low: wait for the window to reset before the next call
+        if (self.rate_limit_remaining is not None
+                and self.rate_limit_remaining < self.RATE_LIMIT_THRESHOLD
+                and self.rate_limit_reset):
+            delay = min(self.MAX_BACKOFF, max(0, self.rate_limit_reset - time.time()))
+            if delay:
+                logger.warning("GitHub rate limit nearly exhausted, waiting %.0fs", delay)
+                time.sleep(delay)
+        
+        # The adapter retries 202 ("still computing") until it gives up; the final
+        # body is only a placeholder, so report "not ready" instead of parsing it
+        if response.status_code == 202 and method == 'GET':
+            raise GitHubNotReadyError(f"GitHub is still preparing {url}", response=response)
+        
+        return response
+
+    def _cached_get(self, url: str, params: Optional[Dict] = None, ttl: float = 300,
+                    fields: Optional[Tuple[str, ...]] = None) -> Any:
+        """
+        GET a URL and return its decoded JSON, served from the response cache when fresh
+        
+        With fields, each object of a list body is reduced to those keys right
+        after decoding, and only the compact form is cached.
+        """
+        return self._cached_get_page(url, params, ttl, fields)[0]
+
+    def _cache_key(self, url: str, variant: Any = None) -> Tuple[tuple, Any]:
+        """
+        Response cache key for a URL, and the shared Redis client (None when unavailable)
+        
+        Keys of repository URLs include the repository's write generation from
+        Redis, so a write recorded by _invalidate_repo makes every worker's
+        cached copies (local and shared) unreachable at once.
+        """
+        shared = get_redis()
+        generation = None
+        generation_key = _generation_key(url)
+        if shared is not None and generation_key:
+            try:
+                generation = shared.get(generation_key)
+            except RedisError as e:
+                logger.warning("Shared GitHub cache unavailable: %s", e)
+                shared = None
+        return (self._cache_namespace, url, variant, generation), shared
+
+    @staticmethod
+    def _redis_key(key: tuple) -> str:
+        """Redis key holding the shared copy of a response cache entry"""
+        return 'ghreal:' + hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+
+    def _invalidate_repo(self, owner: str, repo: str) -> None:
+        """Forget every cached response of a repository after writing to it, in all workers"""
+        repo_url = f"{self.base_url}/repos/{owner}/{repo}/"
+        _response_cache.invalidate_prefix(repo_url)
+        
+        shared = get_redis()
+        if shared is not None:
+            try:
+                shared.incr(_generation_key(repo_url))
+            except RedisError as e:
+                logger.warning("Could not invalidate shared GitHub cache for %s/%s: %s", owner, repo, e)
+
+    def _cached_get_page(self, url: str, params: Optional[Dict] = None, ttl: float = 300,
+                         fields: Optional[Tuple[str, ...]] = None) -> Tuple[Any, int]:
+        """Like _cached_get, also returning the last page number from the Link header (1 if absent)"""
+        query = urlencode(sorted((params or {}).items()))
+        key, shared = self._cache_key(f"{url}?{query}", fields)
+        
+        entry = _response_cache.get_entry(key)
+        if entry is not None and time.time() <= entry[3]:
+            return entry[0]
+        
+        # Second tier: Redis shared by all worker processes. Entries outlive their
+        # freshness so any worker can revalidate them with the stored validators.
+        now = time.time()
+        redis_key = self._redis_key(key)
+        if shared is not None:
+            try:
+                blob = shared.get(redis_key)
+            except RedisError as e:
+                logger.warning("Shared GitHub cache unavailable: %s", e)
+                shared = None
+            else:
+                if blob is not None:
+                    data, last_page, etag, last_modified, expires_at = json_loads(blob)
+                    page = (data, last_page)
+                    if expires_at >= now:
+                        _response_cache.set(key, page, expires_at - now, etag, last_modified)
+                        return page
+                    if entry is None:
+                        entry = (page, etag, last_modified, expires_at)
+        
+        # Revalidate an expired entry; a 304 does not count against the rate limit
+        headers = {}
+        if entry is not None:
+            if entry[1]:
+                headers['If-None-Match'] = entry[1]
+            if entry[2]:
+                headers['If-Modified-Since'] = entry[2]
+        
+        response = self._request_with_backoff('GET', url, params=params, headers=headers or None)
+        
+        if response.status_code == 304 and entry is not None:
+            page, etag, last_modified = entry[0], entry[1], entry[2]
+            fresh_for = self._max_age(response, ttl)
+        else:
+            response.raise_for_status()
+            data = _parse(response)
+            if fields and isinstance(data, list):
+                data = [_project(item, fields) for item in data]
+            page = (data, self._last_page(response))
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            fresh_for = ttl
+        
+        # Endpoints like events ask clients not to poll more often than X-Poll-Interval
+        poll_interval = response.headers.get('X-Poll-Interval', '')
+        if poll_interval.isdigit():
+            fresh_for = max(fresh_for, int(poll_interval))
+        
+        _response_cache.set(key, page, fresh_for, etag=etag, last_modified=last_modified)
+        if shared is not None:
+            blob = json_dumps([page[0], page[1], etag, last_modified, now + fresh_for])
+            try:
+                shared.setex(redis_key, self.SHARED_VALIDATOR_TTL, blob)
+            except RedisError as e:
+                logger.warning("Could not write to shared GitHub cache: %s", e)
+        return page
+
+    @staticmethod
+    def _last_page(response: requests.Response) -> int:
+        """Page number of the rel="last" link, or 1 for single-page responses"""
+        last_url = response.links.get('last', {}).get('url')
+        if not last_url:
+            return 1
+        
+        page = parse_qs(urlparse(last_url).query).get('page', ['1'])[0]
+        return int(page) if page.isdigit() else 1
+
+    def _paginate(self, url: str, params: Dict, ttl: float, items_key: Optional[str] = None,
+                  max_pages: int = MAX_PAGES, fields: Optional[Tuple[str, ...]] = None) -> List[Dict]:
+        """
+        Fetch every page of a list endpoint, up to max_pages
+        
+        Page 1 tells us (via Link rel="last") how many pages exist; the rest are
+        fetched concurrently and concatenated in order. items_key names the list
+        inside object bodies (e.g. 'items' for search).
+        """
+        first, last_page = self._cached_get_page(url, params, ttl, fields)
+        pages = [first]
+        
+        last_page = min(last_page, max_pages)
+        if last_page > 1:
+            def fetch(page: int) -> Any:
+                return self._cached_get(url, {**params, 'page': page}, ttl, fields)
+            
+            with ThreadPoolExecutor(max_workers=min(self.PAGE_WORKERS, last_page - 1)) as executor:
+                pages.extend(executor.map(fetch, range(2, last_page + 1)))
+        
+        items = []
+        for page in pages:
+            items.extend(page.get(items_key, []) if items_key else page)
+        return items
+
+    @staticmethod
+    def _max_age(response: requests.Response, default: float) -> float:
+        """Freshness lifetime from the Cache-Control max-age directive, else default"""
+        for directive in response.headers.get('Cache-Control', '').split(','):
+            name, _, value = directive.strip().partition('=')
+            if name == 'max-age' and value.isdigit():
+                return int(value)
+        return default
+
+    def graphql(self, query: str, variables: Optional[Dict] = None) -> Optional[Dict]:
+        """POST /graphql → run a GraphQL query, returning its data or None on errors"""
+        response = self._request_with_backoff(
+            'POST', f"{self.base_url}/graphql",
+            json={'query': query, 'variables': variables or {}}
+        )
+        response.raise_for_status()
+        body = _parse(response)
+        
+        if body.get('errors'):
+            logger.error("GraphQL query failed: %s", body['errors'])
+            return None
+        return body.get('data')
+
+    def get_repo_issues_with_assignee_activity(self, owner: str, repo: str,
+                                               days: int = 7) -> Optional[List[Dict]]:
+        """
+        Fetch open issues with their assignee's recent contribution count in one GraphQL walk
+        
+        Issues use the REST field names; the assignee dict additionally carries
+        'recent_contributions' (commits + issues + PRs over the last `days` days).
+        Returns None without a token or on failure so callers can fall back to REST.
+        """
+        if not self.access_token:
+            return None
+        
+        since = (datetime.now(dt_timezone.utc) - timedelta(days=days)).strftime('%Y-%m-%dT%H:%M:%SZ')
+        issues = []
+        cursor = None
+        
+        try:
+            while True:
+                data = self.graphql(
+                    ISSUES_WITH_ASSIGNEE_ACTIVITY_QUERY,
+                    {'owner': owner, 'name': repo, 'since': since, 'cursor': cursor}
+                )
+                if not data or not data.get('repository'):
+                    return None
+                
+                page = data['repository']['issues']
+                for node in page['nodes']:
+                    assignees = node['assignees']['nodes']
+                    assignee = None
+                    if assignees:
+                        contributions = assignees[0]['contributionsCollection']
+                        assignee = {
+                            'login': assignees[0]['login'],
+                            'recent_contributions': (
+                                contributions['totalCommitContributions']
+                                + contributions['totalIssueContributions']
+                                + contributions['totalPullRequestContributions']
+                            ),
+                        }
+                    issues.append({
+                        'number': node['number'],
+                        'title': node['title'],
+                        'html_url': node['url'],
+                        'assignee': assignee,
+                    })
+                
+                if not page['pageInfo']['hasNextPage']:
+                    break
+                cursor = page['pageInfo']['endCursor']
+        except (requests.RequestException, KeyError, TypeError) as e:
+            logger.error("Error fetching issues from %s/%s via GraphQL: %s", owner, repo, e)
+            return None
+        
+        logger.info("Fetched %d open issues from %s/%s via GraphQL", len(issues), owner, repo)
+        return issues
+
+    def get_repo_issues_with_comments(self, owner: str, repo: str, count: int = 10,
+                                      comments: int = 20) -> Optional[List[Dict]]:
+        """
+        Fetch the newest issues together with their first comments in one GraphQL query
+        
+        Issues use the REST field names plus 'recent_comments', a list shaped like
+        get_issue_comments(), so one request replaces 1 + N REST calls.
+        Returns None without a token or on failure so callers can fall back to REST.
+        """
+        if not self.access_token:
+            return None
+        
+        # Keyed under the repository URL so writes to the repository invalidate it
+        key, shared = self._cache_key(
+            f"{self.base_url}/repos/{owner}/{repo}/issues#graphql", (count, comments)
+        )
+        issues = _response_cache.get(key)
+        if issues is not None:
+            return issues
+        
+        now = time.time()
+        redis_key = self._redis_key(key)
+        if shared is not None:
+            try:
+                blob = shared.get(redis_key)
+            except RedisError as e:
+                logger.warning("Shared GitHub cache unavailable: %s", e)
+                shared = None
+            else:
+                if blob is not None:
+                    issues, expires_at = json_loads(blob)
+                    if expires_at >= now:
+                        _response_cache.set(key, issues, expires_at - now)
+                        return issues
+        
+        try:
+            data = self.graphql(
+                ISSUES_WITH_COMMENTS_QUERY,
+                {'owner': owner, 'name': repo, 'first': count, 'comments': comments}
+            )
+            if not data or not data.get('repository'):
+                return None
+            
+            issues = []
+            for node in data['repository']['issues']['nodes']:
+                assignees = node['assignees']['nodes']
+                issues.append({
+                    'id': node['databaseId'],
+                    'number': node['number'],
+                    'title': node['title'],
+                    'body': node['body'],
+                    'state': node['state'].lower(),
+                    'assignee': {'login': assignees[0]['login']} if assignees else None,
+                    'created_at': node['createdAt'],
+                    'updated_at': node['updatedAt'],
+                    'recent_comments': [
+                        {
+                            'id': comment['databaseId'],
+                            'user_login': (comment['author'] or _NO_USER).get('login'),
+                            'user_id': (comment['author'] or _NO_USER).get('databaseId'),
+                            'body': comment['body'],
+                            'reactions': {'total_count': comment['reactions']['totalCount']},
+                            'created_at': comment['createdAt']
+                        }
+                        for comment in node['comments']['nodes']
+                    ],
+                })
+        except (requests.RequestException, KeyError, TypeError) as e:
+            logger.error("Error fetching issues with comments from %s/%s via GraphQL: %s", owner, repo, e)
+            return None
+        
+        _response_cache.set(key, issues, self.ISSUES_TTL)
+        if shared is not None:
+            try:
+                shared.setex(redis_key, self.ISSUES_TTL, json_dumps([issues, now + self.ISSUES_TTL]))
+            except RedisError as e:
+                logger.warning("Could not write to shared GitHub cache: %s", e)
+        logger.info("Fetched %d issues with comments from %s/%s via GraphQL", len(issues), owner, repo)
+        return issues
+
+    def get_repo_issues(self, owner: str, repo: str, state: str = 'all',
+                        assignee: Optional[str] = None, pulls: bool = True,
+                        fields: Optional[Tuple[str, ...]] = None,
+                        per_page: int = 100, max_pages: int = MAX_PAGES) -> List[Dict]:
         """
         GET /repos/{owner}/{repo}/issues → fetch all issues
+        
+        state and assignee ('*' = any, 'none' = unassigned) filter server-side;
+        pulls=False drops the pull requests GitHub mixes into this endpoint.
+        fields keeps only those keys of each issue (nested users reduced to login).
+        Callers that only need the newest few issues pass a small per_page and max_pages=1.
         """
         url = f"{self.base_url}/repos/{owner}/{repo}/issues"
-        params = {'state': 'all', 'per_page': 100}
+        params = {'state': state, 'per_page': per_page}
+        if assignee:
+            params['assignee'] = assignee
         
         try:
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            issues = response.json()
+            issues = self._paginate(url, params, self.ISSUES_TTL, max_pages=max_pages, fields=fields)
+            if not pulls:
+                issues = [issue for issue in issues if 'pull_request' not in issue]
             
-            logger.info(f"Fetched {len(issues)} issues from {owner}/{repo}")
+            logger.info("Fetched %d issues from %s/%s", len(issues), owner, repo)
             return issues
             
         except requests.RequestException as e:
-            logger.error(f"Error fetching issues from {owner}/{repo}: {e}")
+            logger.error("Error fetching issues from %s/%s: %s", owner, repo, e)
             return []
 
     def get_issue_comments(self, owner: str, repo: str, issue_number: int) -> List[Dict]:
@@ -59,48 +728,46 @@ class RealGitHubService:
         url = f"{self.base_url}/repos/{owner}/{repo}/issues/{issue_number}/comments"
         
         try:
-            response = self.session.get(url)
-            response.raise_for_status()
-            comments = response.json()
-            
-            # Extract the fields you specified
-            processed_comments = []
-            for comment in comments:
-                processed_comment = {
-                    'id': comment.get('id'),
-                    'user_login': comment.get('user', {}).get('login'),
-                    'user_id': comment.get('user', {}).get('id'),
-                    'body': comment.get('body'),
-                    'reactions': comment.get('reactions', {}),
-                    'created_at': comment.get('created_at')
+            comments = self._cached_get(url, ttl=self.COMMENTS_TTL)
+            
+            # Extract the fields you specified in a single pass; these four keys
+            # are always present on issue comments, reactions may be omitted
+            processed_comments = [
+                {
+                    'id': comment_id,
+                    'user_login': (user or _NO_USER).get('login'),
+                    'user_id': (user or _NO_USER).get('id'),
+                    'body': body,
+                    'reactions': comment.get('reactions') or {},
+                    'created_at': created_at
                 }
-                processed_comments.append(processed_comment)
+                for comment in comments
+                for comment_id, user, body, created_at in (_COMMENT_FIELDS(comment),)
+            ]
             
-            logger.info(f"Fetched {len(processed_comments)} comments for issue #{issue_number}")
+            logger.info("Fetched %d comments for issue #%s", len(processed_comments), issue_number)
             return processed_comments
             
-        except requests.RequestException as e:
-            logger.error(f"Error fetching comments for issue #{issue_number}: {e}")
+        except (requests.RequestException, KeyError) as e:
+            logger.error("Error fetching comments for issue #%s: %s", issue_number, e)
             return []
 
-    def get_user_events(self, username: str) -> List[Dict]:
+    def get_user_events(self, username: str, per_page: int = 30) -> List[Dict]:
         """
         GET /users/{username}/events/public → fetch user activity
         Returns: actor.login and full event data as provided in your example
         """
         url = f"{self.base_url}/users/{username}/events/public"
-        params = {'per_page': 30}  # Get recent 30 events
+        params = {'per_page': per_page}  # Most recent events first
         
         try:
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            events = response.json()
+            events = self._cached_get(url, params, self.EVENTS_TTL)
             
-            logger.info(f"Fetched {len(events)} events for user {username}")
+            logger.info("Fetched %d events for user %s", len(events), username)
             return events
             
         except requests.RequestException as e:
-            logger.error(f"Error fetching events for user {username}: {e}")
+            logger.error("Error fetching events for user %s: %s", username, e)
             return []
 
     def search_user_comments(self, username: str) -> List[Dict]:
@@ -115,16 +782,15 @@ class RealGitHubService:
         }
         
         try:
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            
-            items = data.get('items', [])
-            logger.info(f"Found {len(items)} issues with comments by {username}")
+            items = self._paginate(
+                url, params, self.SEARCH_TTL, items_key='items',
+                max_pages=self.SEARCH_RESULT_CAP // params['per_page']
+            )
+            logger.info("Found %d issues with comments by %s", len(items), username)
             return items
             
         except requests.RequestException as e:
-            logger.error(f"Error searching comments by {username}: {e}")
+            logger.error("Error searching comments by %s: %s", username, e)
             return []
 
     def get_repo_commits(self, owner: str, repo: str, since: str = None) -> List[Dict]:
@@ -138,15 +804,13 @@ class RealGitHubService:
             params['since'] = since
         
         try:
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            commits = response.json()
+            commits = self._paginate(url, params, self.COMMITS_TTL)
             
-            logger.info(f"Fetched {len(commits)} commits from {owner}/{repo}")
+            logger.info("Fetched %d commits from %s/%s", len(commits), owner, repo)
             return commits
             
         except requests.RequestException as e:
-            logger.error(f"Error fetching commits from {owner}/{repo}: {e}")
+            logger.error("Error fetching commits from %s/%s: %s", owner, repo, e)
             return []
 
     def get_rate_limit(self) -> Dict:
@@ -156,12 +820,10 @@ class RealGitHubService:
         url = f"{self.base_url}/rate_limit"
         
         try:
-            response = self.session.get(url)
-            response.raise_for_status()
-            return response.json()
+            return self._cached_get(url, ttl=self.RATE_LIMIT_TTL)
             
         except requests.RequestException as e:
-            logger.error(f"Error fetching rate limit: {e}")
+            logger.error("Error fetching rate limit: %s", e)
             return {}
 
     def patch_issue_assignee(self, owner: str, repo: str, issue_number: int, assignees: List[str] = None) -> bool:
@@ -176,14 +838,17 @@ class RealGitHubService:
         data = {'assignees': assignees or []}
         
         try:
-            response = self.session.patch(url, json=data)
+            response = self._request_with_backoff('PATCH', url, json=data)
             response.raise_for_status()
             
-            logger.info(f"Updated assignees for issue #{issue_number}")
+            # Cached issue listings now carry stale assignees
+            self._invalidate_repo(owner, repo)
+            
+            logger.info("Updated assignees for issue #%s", issue_number)
             return True
             
         except requests.RequestException as e:
-            logger.error(f"Error updating issue #{issue_number}: {e}")
+            logger.error("Error updating issue #%s: %s", issue_number, e)
             return False
 
     def post_issue_comment(self, owner: str, repo: str, issue_number: int, body: str) -> Optional[Dict]:
@@ -198,25 +863,78 @@ class RealGitHubService:
         data = {'body': body}
         
         try:
-            response = self.session.post(url, json=data)
+            response = self._request_with_backoff('POST', url, json=data)
             response.raise_for_status()
             
-            comment = response.json()
-            logger.info(f"Posted comment on issue #{issue_number}")
+            comment = _parse(response)
+            self._invalidate_repo(owner, repo)
+            
+            logger.info("Posted comment on issue #%s", issue_number)
             return comment
             
         except requests.RequestException as e:
-            logger.error(f"Error posting comment on issue #{issue_number}: {e}")
+            logger.error("Error posting comment on issue #%s: %s", issue_number, e)
             return None
 
 
+# Trust score points per event type
+EVENT_POINTS = {'PushEvent': 3, 'PullRequestEvent': 2, 'IssueCommentEvent': 2}
+
+# Recent trust scores per (token namespace, username), so one detector run scores a user once
+_trust_cache = MemoryCache(max_size=1024)
+
+
 class TrustScoreCalculator:
     """Calculate trust scores exactly as specified"""
     
+    # Seconds a computed score is reused
+    CACHE_TTL = 60
+    # Seconds a score published to Redis stays valid; refresh_trust_scores_task
+    # republishes tracked users well within this window
+    SHARED_TTL = 10 * 60
+    
     def __init__(self, github_service: RealGitHubService):
         self.github_service = github_service
 
-    def calculate_trust_score(self, username: str) -> Dict:
+    def calculate_trust_score(self, username: str, refresh: bool = False) -> Dict:
+        """
+        Trust score for a user, reusing one computed within the last minute
+        
+        Scores are also published to Redis (when configured), where the periodic
+        refresh task keeps them warm, so a request normally costs one lookup.
+        Results served from either cache carry cached=True. refresh=True skips
+        both caches and recomputes from GitHub.
+        """
+        key = (self.github_service._cache_namespace, username)
+        result = None if refresh else _trust_cache.get(key)
+        if result is not None:
+            return {**result, 'cached': True}
+        
+        shared = get_redis()
+        shared_key = f'trust:{self.github_service._cache_namespace}:{username}'
+        if not refresh and shared is not None:
+            try:
+                blob = shared.get(shared_key)
+            except RedisError as e:
+                logger.warning("Shared trust score cache unavailable: %s", e)
+                shared = None
+            else:
+                if blob is not None:
+                    result = json_loads(blob)
+                    _trust_cache.set(key, result, self.CACHE_TTL)
+                    return {**result, 'cached': True}
+        
+        result = self._compute_trust_score(username)
+        if result['success']:
+            _trust_cache.set(key, result, self.CACHE_TTL)
+            if shared is not None:
+                try:
+                    shared.setex(shared_key, self.SHARED_TTL, json_dumps(result))
+                except RedisError as e:
+                    logger.warning("Could not publish trust score for %s: %s", username, e)
+        return result
+
+    def _compute_trust_score(self, username: str) -> Dict:
         """
         Logic for Trust Score Calculation:
         - Fetch recent 10 events from /users/{username}/events/public
@@ -239,35 +957,24 @@ class TrustScoreCalculator:
             
             # Calculate score
             score = 0
-            event_counts = {'PushEvent': 0, 'PullRequestEvent': 0, 'IssueCommentEvent': 0}
+            event_counts = dict.fromkeys(EVENT_POINTS, 0)
             
-            # Check for events in last 7 days
-            from datetime import timezone as dt_timezone
-            seven_days_ago = datetime.now(dt_timezone.utc) - timedelta(days=7)
+            # Check for events in last 7 days. GitHub timestamps are ISO-8601 UTC
+            # ('...Z'), so they compare correctly as strings against a cutoff.
+            seven_days_ago = (datetime.now(dt_timezone.utc) - timedelta(days=7)).strftime('%Y-%m-%dT%H:%M:%SZ')
             has_recent_activity = False
             
             for event in recent_events:
                 event_type = event.get('type')
-                created_at = event.get('created_at')
                 
-                # Parse event date
-                try:
-                    event_date = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                    if event_date > seven_days_ago:
-                        has_recent_activity = True
-                except:
-                    pass
+                if not has_recent_activity and (event.get('created_at') or '') > seven_days_ago:
+                    has_recent_activity = True
                 
                 # Award points based on event type
-                if event_type == 'PushEvent':
-                    score += 3
-                    event_counts['PushEvent'] += 1
-                elif event_type == 'PullRequestEvent':
-                    score += 2
-                    event_counts['PullRequestEvent'] += 1
-                elif event_type == 'IssueCommentEvent':
-                    score += 2
-                    event_counts['IssueCommentEvent'] += 1
+                points = EVENT_POINTS.get(event_type)
+                if points:
+                    score += points
+                    event_counts[event_type] += 1
             
             # Penalty for no recent activity
             if not has_recent_activity:
@@ -288,11 +995,12 @@ class TrustScoreCalculator:
                 'tag': tag,
                 'event_counts': event_counts,
                 'has_recent_activity': has_recent_activity,
-                'total_events_analyzed': len(recent_events)
+                'total_events_analyzed': len(recent_events),
+                'recent_events': recent_events
             }
             
         except Exception as e:
-            logger.error(f"Error calculating trust score for {username}: {e}")
+            logger.error("Error calculating trust score for %s: %s", username, e)
             return {
                 'success': False,
                 'error': str(e)
@@ -302,6 +1010,9 @@ class TrustScoreCalculator:
 class CookieLickingDetector:
     """Cookie-licking detection logic exactly as specified"""
     
+    # Upper bound on concurrent trust-score lookups
+    max_workers = 16
+    
     def __init__(self, github_service: RealGitHubService, trust_calculator: TrustScoreCalculator):
         self.github_service = github_service
         self.trust_calculator = trust_calculator
@@ -315,24 +1026,47 @@ class CookieLickingDetector:
         - If 3 days pass with no new comment or commit → unassign
         """
         try:
-            # Get all issues from the repository
-            issues = self.github_service.get_repo_issues(owner, repo)
-            
-            inactive_detections = []
+            # One GraphQL query returns the issues together with each assignee's
+            # recent contributions; fall back to the REST issue listing without it
+            issues = self.github_service.get_repo_issues_with_assignee_activity(owner, repo)
+            if issues is None:
+                issues = self.github_service.get_repo_issues(
+                    owner, repo, state='open', assignee='*', pulls=False,
+                    fields=DETECTION_ISSUE_FIELDS
+                )
             
+            # Keep only assigned issues, paired with the assignee's login
+            assigned_issues = []
             for issue in issues:
                 assignee = issue.get('assignee')
                 if not assignee:
                     continue  # Skip unassigned issues
                 
                 assignee_username = assignee.get('login')
-                if not assignee_username:
-                    continue
-                
+                if assignee_username:
+                    assigned_issues.append((issue, assignee_username))
+            
+            # Assignees with commits / issues / PRs in the last 7 days are active and
+            # need no events lookup. Contributions don't include comments, so everyone
+            # else is still checked against their public events.
+            usernames = list({
+                username for issue, username in assigned_issues
+                if not issue['assignee'].get('recent_contributions')
+            })
+            trust_by_user = {}
+            if usernames:
+                with ThreadPoolExecutor(max_workers=min(self.max_workers, len(usernames))) as executor:
+                    trust_by_user = dict(zip(
+                        usernames, executor.map(self.trust_calculator.calculate_trust_score, usernames)
+                    ))
+            
+            inactive_detections = []
+            
+            for issue, assignee_username in assigned_issues:
                 # Check assignee's last activity
-                trust_data = self.trust_calculator.calculate_trust_score(assignee_username)
+                trust_data = trust_by_user.get(assignee_username)
                 
-                if not trust_data['success']:
+                if not trust_data or not trust_data['success']:
                     continue
                 
                 # If user has no recent activity (last 7 days)
@@ -353,7 +1087,7 @@ class CookieLickingDetector:
             return inactive_detections
             
         except Exception as e:
-            logger.error(f"Error checking inactive contributors for {owner}/{repo}: {e}")
+            logger.error("Error checking inactive contributors for %s/%s: %s", owner, repo, e)
             return []
 
     def send_reminder_comment(self, owner: str, repo: str, issue_number: int, assignee: str) -> bool:
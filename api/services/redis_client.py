@@ -0,0 +1,35 @@
+"""
+Shared Redis connection for caches that must be visible to every worker process
+"""
+import threading
+from typing import Optional
+
+from django.conf import settings
+
+try:
+    import redis
+    from redis import RedisError
+except ImportError:  # pragma: no cover - Redis is optional
+    redis = None
+    RedisError = OSError
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_redis() -> Optional["redis.Redis"]:
+    """
+    Return the process-wide Redis client, or None when REDIS_URL is unset
+    or the redis package is not installed
+    """
+    global _client
+
+    url = getattr(settings, 'REDIS_URL', '')
+    if not url or redis is None:
+        return None
+
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = redis.Redis.from_url(url)
+    return _client
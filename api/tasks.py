@@ -0,0 +1,101 @@
+"""
+Background tasks for Cookie-Licking Detection
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, List, Optional
+
+from celery import shared_task
+from django.conf import settings
+from django.utils import timezone
+
+from .models import GitHubUser, RealIssue, InactiveAssigneeDetection
+from .services.real_github_factory import get_github_service
+from .services.real_github_service import TrustScoreCalculator, CookieLickingDetector
+
+logger = logging.getLogger(__name__)
+
+
+def store_detections(repo_owner: str, repo_name: str, detections: List[Dict]) -> None:
+    """Persist detections for issues we already track"""
+    for detection in detections:
+        try:
+            issue = RealIssue.objects.get(
+                repo_owner=repo_owner,
+                repo_name=repo_name,
+                issue_number=detection['issue_number']
+            )
+
+            InactiveAssigneeDetection.objects.update_or_create(
+                issue=issue,
+                assignee_username=detection['assignee'],
+                defaults={
+                    'days_inactive': detection['days_inactive'],
+                    'trust_score_at_detection': detection['trust_score'],
+                }
+            )
+        except RealIssue.DoesNotExist:
+            logger.warning("Issue #%s not found in database", detection['issue_number'])
+
+
+@shared_task
+def check_inactive_contributors_task(repo_owner: str, repo_name: str,
+                                     user_id: Optional[int] = None) -> List[Dict]:
+    """Detect inactive assignees of a repository and store the detections"""
+    github_service = get_github_service(user_id)
+    trust_calculator = TrustScoreCalculator(github_service)
+    detector = CookieLickingDetector(github_service, trust_calculator)
+
+    detections = detector.check_inactive_contributors(repo_owner, repo_name)
+    store_detections(repo_owner, repo_name, detections)
+
+    logger.info(
+        "Detected %d inactive contributors in %s/%s", len(detections), repo_owner, repo_name
+    )
+    return detections
+
+
+@shared_task
+def check_monitored_repositories_task() -> None:
+    """Periodic entry point: queue a check for every repository in MONITORED_REPOSITORIES"""
+    for full_name in settings.MONITORED_REPOSITORIES:
+        repo_owner, _, repo_name = full_name.partition('/')
+        if repo_owner and repo_name:
+            check_inactive_contributors_task.delay(repo_owner, repo_name)
+
+
+@shared_task
+def refresh_trust_scores_task() -> int:
+    """
+    Periodic entry point: recompute the trust score of every tracked GitHub user
+    
+    Fresh scores are published to Redis by TrustScoreCalculator and copied onto
+    the GitHubUser rows, so contributor lookups rarely compute one on demand.
+    """
+    github_service = get_github_service()
+    trust_calculator = TrustScoreCalculator(github_service)
+    users = list(GitHubUser.objects.only('id', 'username'))
+    if not users:
+        return 0
+    
+    refresh = partial(trust_calculator.calculate_trust_score, refresh=True)
+    with ThreadPoolExecutor(max_workers=min(CookieLickingDetector.max_workers, len(users))) as executor:
+        results = list(executor.map(refresh, [user.username for user in users]))
+    
+    checked_at = timezone.now()
+    refreshed = []
+    for user, result in zip(users, results):
+        if result['success']:
+            user.trust_score = result['trust_score']
+            user.tag = result['tag']
+            user.last_activity_check = checked_at
+            # bulk_update skips auto_now, so stamp updated_at explicitly
+            user.updated_at = checked_at
+            refreshed.append(user)
+    GitHubUser.objects.bulk_update(
+        refreshed, ['trust_score', 'tag', 'last_activity_check', 'updated_at']
+    )
+    
+    logger.info("Refreshed trust scores for %d of %d tracked users", len(refreshed), len(users))
+    return len(refreshed)
@@ -1,3 +1,243 @@
-from django.test import TestCase
+import time
+from unittest import mock
 
-# Create your tests here.
+import requests
+from django.test import RequestFactory, TestCase, override_settings
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+
+from .models import ContributorProfile, Repository
+from .services import real_github_service
+from .services.github_service import GitHubAPIService
+from .services.real_github_service import GitHubNotReadyError, MemoryCache, RealGitHubService, TokenPool
+from .views import ListPagination, _table_etag
+
+
+def make_response(status_code=200, body=b'[]', headers=None):
+    """Build a requests.Response as the session would return it"""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    response.headers.update(headers or {})
+    response.url = 'https://api.github.com/test'
+    return response
+
+
+@override_settings(REDIS_URL='')
+class CachedGetPageTests(TestCase):
+    """Response caching in RealGitHubService"""
+
+    url = 'https://api.github.com/repos/octo/demo/issues'
+
+    def setUp(self):
+        patcher = mock.patch.object(real_github_service, '_response_cache', MemoryCache())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.service = RealGitHubService(access_token='test-token')
+        self.service.session = mock.Mock()
+
+    def test_fresh_entry_is_served_without_a_request(self):
+        self.service.session.request.return_value = make_response(body=b'[{"number": 1}]')
+
+        first = self.service._cached_get(self.url, ttl=300)
+        second = self.service._cached_get(self.url, ttl=300)
+
+        self.assertEqual(first, [{'number': 1}])
+        self.assertEqual(second, first)
+        self.assertEqual(self.service.session.request.call_count, 1)
+
+    def test_expired_entry_is_revalidated_with_its_etag(self):
+        self.service.session.request.side_effect = [
+            make_response(body=b'[{"number": 1}]', headers={'ETag': '"v1"'}),
+            make_response(status_code=304, body=b''),
+        ]
+
+        self.service._cached_get(self.url, ttl=-1)
+        data = self.service._cached_get(self.url, ttl=-1)
+
+        self.assertEqual(data, [{'number': 1}])
+        headers = self.service.session.request.call_args.kwargs['headers']
+        self.assertEqual(headers['If-None-Match'], '"v1"')
+
+    def test_final_202_is_reported_as_not_ready(self):
+        self.service.session.request.return_value = make_response(status_code=202, body=b'{}')
+
+        with self.assertRaises(GitHubNotReadyError):
+            self.service._cached_get(self.url, ttl=300)
+        self.assertEqual(self.service.get_repo_issues('octo', 'demo'), [])
+
+    def test_write_invalidates_cached_repository_responses(self):
+        self.service.session.request.side_effect = [
+            make_response(body=b'[{"number": 1, "assignee": {"login": "old"}}]'),
+            make_response(body=b'{}'),
+            make_response(body=b'[{"number": 1, "assignee": null}]'),
+        ]
+
+        self.service._cached_get(self.url, ttl=300)
+        self.assertTrue(self.service.patch_issue_assignee('octo', 'demo', 1, assignees=[]))
+        data = self.service._cached_get(self.url, ttl=300)
+
+        self.assertEqual(data, [{'number': 1, 'assignee': None}])
+        self.assertEqual(self.service.session.request.call_count, 3)
+
+
+@override_settings(REDIS_URL='')
+class StaleFallbackTests(TestCase):
+    """GitHubAPIService._get_json serving the last known body when GitHub fails"""
+
+    url = 'https://api.github.com/users/octo'
+
+    def setUp(self):
+        self.service = GitHubAPIService(token='test-token')
+        self.service.session = mock.Mock()
+        self.service.session.get.return_value = make_response(
+            body=b'{"login": "octo"}', headers={'ETag': '"v1"'}
+        )
+        self.service._get_json(self.url)
+        # Expire the body but keep its ETag validator
+        self.service._cache.clear()
+
+    def test_server_error_serves_stale_body(self):
+        self.service.session.get.return_value = make_response(status_code=503, body=b'')
+
+        self.assertEqual(self.service._get_json(self.url), {'login': 'octo'})
+
+    def test_timeout_serves_stale_body(self):
+        self.service.session.get.side_effect = requests.Timeout()
+
+        self.assertEqual(self.service._get_json(self.url), {'login': 'octo'})
+        self.assertEqual(
+            self.service.session.get.call_args.kwargs['timeout'], GitHubAPIService.REQUEST_TIMEOUT
+        )
+
+    def test_client_error_is_raised(self):
+        self.service.session.get.return_value = make_response(status_code=404, body=b'')
+
+        with self.assertRaises(requests.HTTPError):
+            self.service._get_json(self.url)
+
+
+class ListPaginationTests(TestCase):
+    """ListPagination reading the total count from a window over the page query"""
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        for n in range(3):
+            ContributorProfile.objects.create(
+                username=f'user{n}', profile_url=f'https://github.com/user{n}', trust_score=n
+            )
+
+    def paginate(self, **params):
+        paginator = ListPagination(page_size=2)
+        request = Request(self.factory.get('/api/contributors/', params))
+        with self.assertNumQueries(1):
+            rows = paginator.paginate_queryset(ContributorProfile.objects.order_by('-trust_score'), request)
+        return rows, paginator.page_info()
+
+    def test_first_page_counts_every_row(self):
+        rows, info = self.paginate()
+
+        self.assertEqual([row.username for row in rows], ['user2', 'user1'])
+        self.assertEqual(info['total_count'], 3)
+        self.assertIsNotNone(info['next'])
+        self.assertIsNone(info['previous'])
+
+    def test_last_page_counts_every_row(self):
+        rows, info = self.paginate(page=2)
+
+        self.assertEqual([row.username for row in rows], ['user0'])
+        self.assertEqual(info['total_count'], 3)
+        self.assertIsNone(info['next'])
+
+    def test_page_past_the_end_is_not_found(self):
+        with self.assertRaises(NotFound):
+            ListPagination(page_size=2).paginate_queryset(
+                ContributorProfile.objects.all(), Request(self.factory.get('/api/contributors/', {'page': 3}))
+            )
+
+
+class TableEtagTests(TestCase):
+    """_table_etag validators used by the conditional list and stats views"""
+
+    def setUp(self):
+        self.factory = RequestFactory()
+
+    def create_repository(self, github_id):
+        return Repository.objects.create(
+            name=f'repo-{github_id}', full_name=f'octo/repo-{github_id}', github_id=github_id,
+            owner='octo', url=f'https://github.com/octo/repo-{github_id}'
+        )
+
+    def test_etag_is_stable_while_the_table_is_unchanged(self):
+        self.create_repository(1)
+        request = self.factory.get('/api/stats/')
+
+        self.assertEqual(
+            _table_etag(request, Repository.objects.all()),
+            _table_etag(request, Repository.objects.all())
+        )
+
+    def test_etag_changes_when_rows_are_added(self):
+        self.create_repository(1)
+        request = self.factory.get('/api/stats/')
+        before = _table_etag(request, Repository.objects.all())
+
+        self.create_repository(2)
+
+        self.assertNotEqual(before, _table_etag(request, Repository.objects.all()))
+
+    def test_etag_depends_on_the_query_string(self):
+        queryset = Repository.objects.all()
+
+        self.assertNotEqual(
+            _table_etag(self.factory.get('/api/contributors/?page=1'), queryset),
+            _table_etag(self.factory.get('/api/contributors/?page=2'), queryset)
+        )
+
+    def test_matching_if_none_match_gets_304(self):
+        ContributorProfile.objects.create(username='octo', profile_url='https://github.com/octo')
+        etag = self.client.get('/api/contributors/')['ETag']
+
+        response = self.client.get('/api/contributors/', HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+    def test_stale_if_none_match_gets_the_listing(self):
+        ContributorProfile.objects.create(username='octo', profile_url='https://github.com/octo')
+        etag = self.client.get('/api/contributors/')['ETag']
+        ContributorProfile.objects.create(username='hubot', profile_url='https://github.com/hubot')
+
+        response = self.client.get('/api/contributors/', HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['total_count'], 2)
+
+
+class TokenPoolTests(TestCase):
+    """Token selection in TokenPool"""
+
+    def test_unknown_quota_counts_as_full(self):
+        pool = TokenPool(['a', 'b'])
+        pool.update('a', 100, time.time() + 600)
+
+        self.assertEqual(pool.acquire(), 'b')
+        self.assertEqual(pool.quota(), (None, None))
+
+    def test_token_with_most_remaining_quota_wins(self):
+        pool = TokenPool(['a', 'b', 'c'])
+        reset = time.time() + 600
+        pool.update('a', 100, reset)
+        pool.update('b', 4000, reset)
+        pool.update('c', 0, reset)
+
+        self.assertEqual(pool.acquire(), 'b')
+        self.assertEqual(pool.quota(), (4000, reset))
+
+    def test_token_past_its_reset_counts_as_full(self):
+        pool = TokenPool(['a', 'b'])
+        pool.update('a', 0, time.time() - 1)
+        pool.update('b', 4000, time.time() + 600)
+
+        self.assertEqual(pool.acquire(), 'a')
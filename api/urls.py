@@ -31,6 +31,8 @@ real_urlpatterns = [
     path('real/issues/<int:issue_id>/', real_views.get_issue_details, name='real_get_issue_details'), 
     path('real/contributor-activity/', real_views.get_contributor_activity, name='contributor_activity'),
     path('real/inactive-contributors/', real_views.analyze_inactive_contributors, name='inactive_contributors'),
+    path('real/inactive-contributors/detections/', real_views.get_inactive_detections, name='inactive_detections'),
+    path('real/inactive-contributors/<uuid:job_id>/', real_views.get_inactive_contributors_job, name='inactive_contributors_job'),
     path('real/trust-score/', real_views.calculate_trust_score, name='trust_score'),
     path('real/unassign-user/', real_views.unassign_user, name='unassign_user'),
     path('real/repositories/', real_views.get_repositories, name='get_repositories'),
@@ -5,140 +5,321 @@ from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
-from django.http import JsonResponse, HttpResponseRedirect
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.exceptions import NotFound
+from django.http import HttpResponse, JsonResponse, HttpResponseRedirect
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition, require_GET
 from django.conf import settings
-from django.db import models
-import requests
+from django.core.paginator import Page, Paginator
+from django.core.cache import cache
+from django.db import connection, models
+from asgiref.sync import sync_to_async
+import hashlib
+import json
+import re
+import secrets
+import httpx
 import logging
-from datetime import datetime, timedelta
+import time
+import numpy as np
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlencode
 
 from .models import GoogleUser, ContributorProfile, Issue, Repository
 from .serializers import (
     GoogleUserSerializer, ContributorProfileSerializer, 
     IssueSerializer, RepositorySerializer
 )
-from .services.github_service import GitHubAPIService, CookieLickingDetector
+from .services.github_service import GitHubAPIService, CookieLickingDetector, user_analysis_to_dict
 
 logger = logging.getLogger(__name__)
 
-# Initialize GitHub services
-github_service = GitHubAPIService()
-cookie_detector = CookieLickingDetector(github_service)
 
+# GitHub services are built on first use, once per process, rather than at import
+@lru_cache(maxsize=1)
+def _github() -> GitHubAPIService:
+    """Process-wide GitHub API service"""
+    return GitHubAPIService()
 
-@api_view(['GET'])
-@permission_classes([AllowAny])
+
+@lru_cache(maxsize=1)
+def _detector() -> CookieLickingDetector:
+    """Process-wide cookie-licking detector"""
+    return CookieLickingDetector(_github())
+
+
+# Profile URL accepted by submit_github_url; captures a valid GitHub username
+_GH_URL_RE = re.compile(r'^https://github\.com/([A-Za-z0-9](?:[A-Za-z0-9-]{0,38})?)/?$')
+
+# Timeouts, in seconds, of every request to Google (3s to connect, 10s otherwise)
+GOOGLE_HTTP_TIMEOUT = httpx.Timeout(10, connect=3)
+
+# Upper bound on contributors enriched from GitHub at the same time; keeps
+# list endpoints clear of GitHub's secondary rate limits
+ENRICHMENT_WORKERS = 16
+
+
+# Bodies of the constant endpoints, encoded once at import
+_HEALTH_BODY = json.dumps({
+    'status': 'healthy',
+    'message': 'Cookie-Licking Detection API is running',
+    'version': '2.0'
+}).encode()
+
+_API_INFO_BODY = json.dumps({
+    'name': 'Cookie-Licking Detection API',
+    'description': 'AI-powered system to detect and resolve issue assignment abandonment',
+    'features': [
+        'GitHub OAuth integration',
+        'AI-powered trust scoring',
+        'Automated reminder system',
+        'Smart contributor analysis'
+    ],
+    'endpoints': {
+        'health': '/api/health/',
+        'info': '/api/info/',
+        'github_auth': '/api/auth/github/login/',
+        'issues': '/api/issues/',
+        'contributors': '/api/contributors/'
+    }
+}).encode()
+
+
+@cache_control(public=True, max_age=10)
+@require_GET
 def health_check(request):
     """Health check endpoint"""
-    return Response({
-        'status': 'healthy',
-        'message': 'Cookie-Licking Detection API is running',
-        'version': '2.0'
-    })
+    return HttpResponse(_HEALTH_BODY, content_type='application/json')
 
 
-@api_view(['GET'])
-@permission_classes([AllowAny])
+@cache_control(public=True, max_age=3600)
+@require_GET
 def api_info(request):
     """API information endpoint"""
-    return Response({
-        'name': 'Cookie-Licking Detection API',
-        'description': 'AI-powered system to detect and resolve issue assignment abandonment',
-        'features': [
-            'GitHub OAuth integration',
-            'AI-powered trust scoring',
-            'Automated reminder system',
-            'Smart contributor analysis'
-        ],
-        'endpoints': {
-            'health': '/api/health/',
-            'info': '/api/info/',
-            'github_auth': '/api/auth/github/login/',
-            'issues': '/api/issues/',
-            'contributors': '/api/contributors/'
+    return HttpResponse(_API_INFO_BODY, content_type='application/json')
+
+
+def _github_enrichment(username: str) -> Dict:
+    """GitHub profile and recent activity fields for one contributor"""
+    enrichment = {}
+    try:
+        # Get user details from GitHub
+        github_user = _github().get_user_details(username)
+        if github_user:
+            enrichment['github_data'] = {
+                'followers': github_user.get('followers', 0),
+                'following': github_user.get('following', 0),
+                'public_repos': github_user.get('public_repos', 0),
+                'created_at': github_user.get('created_at'),
+                'updated_at': github_user.get('updated_at'),
+                'company': github_user.get('company'),
+                'location': github_user.get('location'),
+                'blog': github_user.get('blog'),
+                'bio': github_user.get('bio')
+            }
+        
+        # Get recent activity analysis
+        recent_events = _github().get_user_events(username, pages=1)
+        if recent_events:
+            enrichment['recent_activity'] = {
+                'total_events': len(recent_events),
+                'event_types': list(dict.fromkeys(event.get('type') for event in recent_events)),
+                'last_activity': recent_events[0].get('created_at') if recent_events else None
+            }
+    
+    except Exception as e:
+        logger.warning("GitHub API error for %s: %s", username, e)
+        enrichment['github_error'] = str(e)
+    
+    return enrichment
+
+
+class ListPagination(PageNumberPagination):
+    """Page-number pagination for the list endpoints; clients may pick ?page_size="""
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    
+    def __init__(self, page_size: int):
+        self.page_size = page_size
+    
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Fetch one page, reading the total row count from a COUNT(*) OVER ()
+        window on the same query instead of a separate COUNT query
+        """
+        self.request = request
+        page_size = self.get_page_size(request)
+        try:
+            page_number = int(request.query_params.get(self.page_query_param, 1))
+        except ValueError:
+            raise NotFound('Invalid page.')
+        if page_number < 1:
+            raise NotFound('Invalid page.')
+        
+        offset = (page_number - 1) * page_size
+        rows = list(
+            queryset.annotate(_total_count=models.Window(models.Count('*')))[offset:offset + page_size]
+        )
+        if not rows and page_number > 1:
+            raise NotFound('Invalid page.')
+        
+        # Seed the paginator's cached count so Page/link helpers don't re-count
+        paginator = Paginator(queryset, page_size)
+        paginator.count = rows[0]._total_count if rows else 0
+        self.page = Page(rows, page_number, paginator)
+        return rows
+    
+    def page_info(self) -> Dict:
+        """Total row count and neighbouring page links of the current page"""
+        return {
+            'total_count': self.page.paginator.count,
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link()
         }
-    })
 
 
+def _table_etag(request, *querysets) -> str:
+    """ETag from the query string plus the newest update and row count of each queryset"""
+    state = [request.GET.urlencode()]
+    for queryset in querysets:
+        summary = queryset.aggregate(latest=models.Max('updated_at'), rows=models.Count('id'))
+        state.append((summary['latest'], summary['rows']))
+    return hashlib.blake2b(repr(state).encode(), digest_size=8).hexdigest()
+
+
+def _contributors_etag(request) -> Optional[str]:
+    """ETag of the database-only contributor listing; enriched responses carry live GitHub data"""
+    if request.GET.get('enrich') == '1':
+        return None
+    return _table_etag(request, ContributorProfile.objects.all())
+
+
+def _issues_etag(request) -> Optional[str]:
+    """ETag of the database-only open issue listing; enriched responses carry live GitHub data"""
+    if request.GET.get('enrich') == '1':
+        return None
+    return _table_etag(request, Issue.objects.filter(state='open'))
+
+
+def _stats_etag(request) -> str:
+    """
+    ETag of the stats payload: every table it counts plus the current
+    GitHub probe interval, so the live GitHub parts still refresh
+    """
+    return _table_etag(
+        request, ContributorProfile.objects.all(), Issue.objects.all(),
+        Repository.objects.all(), GoogleUser.objects.all()
+    ) + f"-{int(time.time() // GITHUB_PROBE_INTERVAL)}"
+
+
+@condition(etag_func=_contributors_etag)
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def list_contributors(request):
-    """List all contributor profiles with real GitHub analysis"""
+    """
+    List contributor profiles, 10 per page (?page=, ?page_size=);
+    pass ?enrich=1 to add real GitHub analysis for the page
+    """
+    # Get contributors with their current data
+    paginator = ListPagination(page_size=10)
+    contributors = paginator.paginate_queryset(
+        ContributorProfile.objects.order_by('-trust_score'), request
+    )
+    
     try:
-        # Get contributors with their current data
-        contributors = ContributorProfile.objects.all().order_by('-trust_score')[:10]
+        if request.GET.get('enrich') != '1':
+            return Response({
+                'contributors': ContributorProfileSerializer(contributors, many=True).data,
+                **paginator.page_info(),
+                'enhanced_with_github': False
+            })
         
-        # Enhance with real GitHub data
-        enhanced_contributors = []
-        for contributor in contributors:
-            # Get basic serialized data
-            contributor_data = ContributorProfileSerializer(contributor).data
+        # Serialize on the request thread; only the GitHub calls run in the pool
+        enhanced_contributors = [ContributorProfileSerializer(c).data for c in contributors]
+        usernames = [
+            c.username if c.username and c.username != 'sample_user' else None
+            for c in contributors
+        ]
+        
+        # Enhance with real GitHub data, overlapping the per-contributor round trips
+        to_enrich = list(dict.fromkeys(username for username in usernames if username))
+        if to_enrich:
+            with ThreadPoolExecutor(max_workers=min(ENRICHMENT_WORKERS, len(to_enrich))) as executor:
+                enrichments = dict(zip(to_enrich, executor.map(_github_enrichment, to_enrich)))
             
-            # Add real GitHub analysis if username exists
-            if contributor.username and contributor.username != 'sample_user':
-                try:
-                    # Get user details from GitHub
-                    github_user = github_service.get_user_details(contributor.username)
-                    if github_user:
-                        contributor_data['github_data'] = {
-                            'followers': github_user.get('followers', 0),
-                            'following': github_user.get('following', 0),
-                            'public_repos': github_user.get('public_repos', 0),
-                            'created_at': github_user.get('created_at'),
-                            'updated_at': github_user.get('updated_at'),
-                            'company': github_user.get('company'),
-                            'location': github_user.get('location'),
-                            'blog': github_user.get('blog'),
-                            'bio': github_user.get('bio')
-                        }
-                    
-                    # Get recent activity analysis
-                    recent_events = github_service.get_user_events(contributor.username, pages=1)
-                    if recent_events:
-                        contributor_data['recent_activity'] = {
-                            'total_events': len(recent_events),
-                            'event_types': list(set([event.get('type') for event in recent_events])),
-                            'last_activity': recent_events[0].get('created_at') if recent_events else None
-                        }
-                    
-                    # Calculate real trust score based on GitHub data
-                    trust_analysis = cookie_detector.calculate_trust_score(contributor.username)
-                    if trust_analysis['success']:
-                        contributor_data['real_trust_score'] = trust_analysis['trust_score']
-                        contributor_data['trust_factors'] = trust_analysis['factors']
-                
-                except Exception as e:
-                    logger.warning(f"GitHub API error for {contributor.username}: {e}")
-                    contributor_data['github_error'] = str(e)
+            # Score the whole page in one vectorized pass
+            trust_scores, trust_factors = _detector().batch_calculate_trust_scores(to_enrich)
+            for username, trust_score, factors in zip(to_enrich, trust_scores, trust_factors):
+                if factors is not None:
+                    enrichments[username]['real_trust_score'] = float(trust_score)
+                    enrichments[username]['trust_factors'] = factors
             
-            enhanced_contributors.append(contributor_data)
+            for contributor_data, username in zip(enhanced_contributors, usernames):
+                if username:
+                    contributor_data.update(enrichments[username])
         
         return Response({
             'contributors': enhanced_contributors,
-            'total_count': ContributorProfile.objects.count(),
+            **paginator.page_info(),
             'enhanced_with_github': True
         })
     
     except Exception as e:
-        logger.error(f"Contributors endpoint error: {e}")
+        logger.error("Contributors endpoint error: %s", e)
         # Fallback to basic data
-        contributors = ContributorProfile.objects.all().order_by('-trust_score')[:10]
         serializer = ContributorProfileSerializer(contributors, many=True)
         return Response({
             'contributors': serializer.data,
-            'total_count': ContributorProfile.objects.count(),
+            **paginator.page_info(),
             'enhanced_with_github': False,
             'error': str(e)
         })
 
 
+# Joined repository columns IssueSerializer and the analysis never read
+ISSUE_LIST_DEFERRED_FIELDS = (
+    'repository__description', 'repository__url', 'repository__language',
+    'repository__github_id', 'repository__created_at', 'repository__updated_at',
+)
+
+
+@condition(etag_func=_issues_etag)
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def list_issues(request):
-    """List all issues with cookie-licking detection analysis"""
+    """
+    List open issues, 20 per page (?page=, ?page_size=);
+    pass ?enrich=1 to add cookie-licking detection analysis for the page
+    """
+    # Get issues with their current data
+    paginator = ListPagination(page_size=20)
+    issues = paginator.paginate_queryset(
+        Issue.objects.filter(state='open').select_related('repository')
+        .defer(*ISSUE_LIST_DEFERRED_FIELDS).order_by('-created_at'),
+        request
+    )
+    
     try:
-        # Get issues with their current data
-        issues = Issue.objects.filter(state='open').order_by('-created_at')[:20]
+        if request.GET.get('enrich') != '1':
+            return Response({
+                'issues': IssueSerializer(issues, many=True).data,
+                **paginator.page_info(),
+                'cookie_licking_enabled': False
+            })
+        
+        # Comments of every analyzable issue in one GraphQL request; anything
+        # missing from the batch falls back to a REST lookup per issue
+        targets = [
+            (issue.repository.owner, issue.repository.name, issue.issue_number)
+            for issue in issues
+            if issue.repository and issue.issue_number and issue.assignee
+        ]
+        batched = _github().graphql_batch_issues(targets) or {}
         
         # Enhance with real cookie-licking detection
         enhanced_issues = []
@@ -149,25 +330,22 @@ def list_issues(request):
             # Add real cookie-licking analysis if we have repo and issue number
             if issue.repository and issue.issue_number and issue.assignee:
                 try:
-                    repo_full_name = f"{issue.repository.owner}/{issue.repository.name}"
+                    owner, repo_name = issue.repository.owner, issue.repository.name
                     
-                    # Get issue comments for analysis
-                    owner, repo_name = repo_full_name.split('/')
-                    comments = github_service.get_issue_comments(
-                        owner, 
-                        repo_name,
-                        issue.issue_number
-                    )
-                    
-                    # Analyze for cookie-licking patterns
-                    cookie_analysis = cookie_detector.analyze_issue_for_cookie_licking(
+                    # Analyze for cookie-licking patterns; without batched comments
+                    # the detector fetches them itself and hands them back
+                    batch_entry = batched.get((owner, repo_name, issue.issue_number))
+                    cookie_analysis = _detector().analyze_issue_for_cookie_licking(
                         owner,
                         repo_name,
                         issue.issue_number,
-                        issue.assignee
+                        issue.assignee,
+                        comments=batch_entry['comments'] if batch_entry else None
                     )
                     
                     if cookie_analysis['success']:
+                        comments = cookie_analysis['comments']
+                        total_comments = batch_entry['total_comments'] if batch_entry else len(comments)
                         issue_data['cookie_licking_analysis'] = {
                             'risk_level': cookie_analysis['risk_level'],
                             'patterns_detected': cookie_analysis['patterns_detected'],
@@ -182,12 +360,12 @@ def list_issues(request):
                         if comments:
                             claiming_patterns = []
                             for comment in comments[:5]:  # Check last 5 comments
-                                patterns = cookie_detector.detect_claiming_patterns(comment.get('body', ''))
+                                patterns = _detector().detect_claiming_patterns(comment.get('body', ''))
                                 if patterns:
                                     claiming_patterns.extend(patterns)
                             
                             issue_data['claiming_patterns'] = claiming_patterns
-                            issue_data['total_comments'] = len(comments)
+                            issue_data['total_comments'] = total_comments
                     
                     else:
                         issue_data['cookie_licking_analysis'] = {
@@ -195,7 +373,7 @@ def list_issues(request):
                         }
                 
                 except Exception as e:
-                    logger.warning(f"Cookie-licking analysis error for issue {issue.issue_number}: {e}")
+                    logger.warning("Cookie-licking analysis error for issue %s: %s", issue.issue_number, e)
                     issue_data['analysis_error'] = str(e)
             
             else:
@@ -208,43 +386,127 @@ def list_issues(request):
         
         return Response({
             'issues': enhanced_issues,
-            'total_count': Issue.objects.filter(state='open').count(),
+            **paginator.page_info(),
             'cookie_licking_enabled': True
         })
     
     except Exception as e:
-        logger.error(f"Issues endpoint error: {e}")
+        logger.error("Issues endpoint error: %s", e)
         # Fallback to basic data
-        issues = Issue.objects.filter(state='open').order_by('-created_at')[:20]
         serializer = IssueSerializer(issues, many=True)
         return Response({
             'issues': serializer.data,
-            'total_count': Issue.objects.filter(state='open').count(),
+            **paginator.page_info(),
             'cookie_licking_enabled': False,
             'error': str(e)
         })
 
 
+# Seconds for which the GitHub API status reported by stats() is reused
+GITHUB_PROBE_INTERVAL = 60
+
+
+@lru_cache(maxsize=1)
+def _probe_github(bucket: int) -> Dict:
+    """
+    GitHub API status fields for stats(); `bucket` changes every
+    GITHUB_PROBE_INTERVAL seconds, which expires the cached result
+    """
+    try:
+        test_user = _github().get_user_details('octocat')  # Test with GitHub's mascot
+        return {'github_api_status': 'operational' if test_user else 'limited'}
+    except Exception as e:
+        return {'github_api_status': 'error', 'github_api_error': str(e)}
+
+
+# Lower edges of the medium and high trust buckets
+TRUST_BUCKET_EDGES = np.array([50, 80])
+
+
+def _trust_distribution(scores: np.ndarray) -> Dict:
+    """Low/medium/high trust counts and the average of a trust score column"""
+    low, medium, high = np.bincount(np.digitize(scores, TRUST_BUCKET_EDGES), minlength=3)
+    return {
+        'high_trust': int(high),
+        'medium_trust': int(medium),
+        'low_trust': int(low),
+        'average_trust': float(scores.mean()) if scores.size else 0
+    }
+
+
+# Cache key and lifetime (seconds) of the database counts reported by stats()
+BASIC_STATS_CACHE_KEY = 'stats:v1'
+BASIC_STATS_CACHE_TTL = 30
+
+
+def _basic_stats() -> Dict:
+    """Database counts reported by the stats endpoint, cached for BASIC_STATS_CACHE_TTL"""
+    basic_stats = cache.get(BASIC_STATS_CACHE_KEY)
+    if basic_stats is not None:
+        return basic_stats
+    
+    issue_counts = Issue.objects.aggregate(
+        total=models.Count('id'),
+        open=models.Count('id', filter=models.Q(state='open')),
+        assigned=models.Count(
+            'id', filter=models.Q(assignee__isnull=False) & ~models.Q(assignee='')
+        ),
+    )
+    
+    # Row counts of the remaining tables as scalar subqueries of one statement
+    tables = [model._meta.db_table for model in (ContributorProfile, Repository, GoogleUser)]
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT ' + ', '.join(
+            f'(SELECT COUNT(*) FROM {connection.ops.quote_name(table)})' for table in tables
+        ))
+        total_contributors, repositories, google_users = cursor.fetchone()
+    
+    basic_stats = {
+        'total_contributors': total_contributors,
+        'total_issues': issue_counts['total'],
+        'open_issues': issue_counts['open'],
+        'assigned_issues': issue_counts['assigned'],
+        'repositories': repositories,
+        'google_users': google_users
+    }
+    cache.set(BASIC_STATS_CACHE_KEY, basic_stats, BASIC_STATS_CACHE_TTL)
+    return basic_stats
+
+
+def _analyze_assigned_issue(target: Tuple[str, str, int, str]) -> Optional[Dict]:
+    """Cookie-licking analysis of one (owner, repo, issue_number, assignee), or None on error"""
+    owner, repo_name, issue_number, assignee = target
+    try:
+        return _detector().analyze_issue_for_cookie_licking(owner, repo_name, issue_number, assignee)
+    except Exception as e:
+        logger.warning("Stats analysis error for issue %s: %s", issue_number, e)
+        return None
+
+
+@condition(etag_func=_stats_etag)
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def stats(request):
     """Enhanced statistics with real GitHub analysis"""
     try:
         # Basic database stats
-        basic_stats = {
-            'total_contributors': ContributorProfile.objects.count(),
-            'total_issues': Issue.objects.count(),
-            'open_issues': Issue.objects.filter(state='open').count(),
-            'assigned_issues': Issue.objects.exclude(assignee__isnull=True).exclude(assignee='').count(),
-            'repositories': Repository.objects.count(),
-            'google_users': GoogleUser.objects.count()
-        }
+        # One query for the trust score column; buckets are computed locally
+        # (streamed in chunks so no QuerySet result cache is built)
+        trust_scores = np.fromiter(
+            ContributorProfile.objects.values_list('trust_score', flat=True).iterator(chunk_size=5000),
+            dtype=np.float64
+        )
+        basic_stats = _basic_stats()
         
         # Enhanced stats with real analysis
         enhanced_stats = basic_stats.copy()
         
         # Analyze assigned issues for cookie-licking patterns
-        assigned_issues = Issue.objects.exclude(assignee__isnull=True).exclude(assignee='').filter(state='open')
+        assigned_issues = (
+            Issue.objects.exclude(assignee__isnull=True).exclude(assignee='')
+            .filter(state='open').select_related('repository')
+            .only('issue_number', 'assignee', 'repository', 'repository__owner', 'repository__name')
+        )
         cookie_licking_stats = {
             'total_analyzed': 0,
             'high_risk': 0,
@@ -258,86 +520,95 @@ def stats(request):
             }
         }
         
-        for issue in assigned_issues[:10]:  # Analyze first 10 for performance
-            if issue.repository and issue.issue_number and issue.assignee:
-                try:
-                    repo_full_name = f"{issue.repository.owner}/{issue.repository.name}"
-                    analysis = cookie_detector.analyze_issue_for_cookie_licking(
-                        repo_full_name,
-                        issue.issue_number,
-                        issue.assignee
-                    )
-                    
-                    if analysis['success']:
-                        cookie_licking_stats['total_analyzed'] += 1
-                        risk_level = analysis.get('risk_level', 'low')
-                        
-                        if risk_level == 'high':
-                            cookie_licking_stats['high_risk'] += 1
-                        elif risk_level == 'medium':
-                            cookie_licking_stats['medium_risk'] += 1
-                        else:
-                            cookie_licking_stats['low_risk'] += 1
-                        
-                        if analysis.get('patterns_detected'):
-                            cookie_licking_stats['patterns_detected'] += len(analysis['patterns_detected'])
-                        
-                        # Count recommendations
-                        recommendation = analysis.get('recommendation', 'monitor').lower()
-                        if 'unassign' in recommendation:
-                            cookie_licking_stats['recommendations']['unassign'] += 1
-                        elif 'reminder' in recommendation:
-                            cookie_licking_stats['recommendations']['reminder'] += 1
-                        else:
-                            cookie_licking_stats['recommendations']['monitor'] += 1
+        # Analyze first 10 for performance; the GitHub calls run concurrently
+        targets = [
+            (issue.repository.owner, issue.repository.name, issue.issue_number, issue.assignee)
+            for issue in assigned_issues[:10]
+            if issue.repository and issue.issue_number and issue.assignee
+        ]
+        analyses = []
+        if targets:
+            with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+                analyses = list(executor.map(_analyze_assigned_issue, targets))
+        
+        for analysis in analyses:
+            if analysis and analysis['success']:
+                cookie_licking_stats['total_analyzed'] += 1
+                risk_level = analysis.get('risk_level', 'low')
                 
-                except Exception as e:
-                    logger.warning(f"Stats analysis error for issue {issue.issue_number}: {e}")
+                if risk_level == 'high':
+                    cookie_licking_stats['high_risk'] += 1
+                elif risk_level == 'medium':
+                    cookie_licking_stats['medium_risk'] += 1
+                else:
+                    cookie_licking_stats['low_risk'] += 1
+                
+                if analysis.get('patterns_detected'):
+                    cookie_licking_stats['patterns_detected'] += len(analysis['patterns_detected'])
+                
+                # Count recommendations
+                recommendation = analysis.get('recommendation', 'monitor').lower()
+                if 'unassign' in recommendation:
+                    cookie_licking_stats['recommendations']['unassign'] += 1
+                elif 'reminder' in recommendation:
+                    cookie_licking_stats['recommendations']['reminder'] += 1
+                else:
+                    cookie_licking_stats['recommendations']['monitor'] += 1
         
         enhanced_stats['cookie_licking_detection'] = cookie_licking_stats
         
-        # GitHub API health check
-        try:
-            test_user = github_service.get_user_details('octocat')  # Test with GitHub's mascot
-            enhanced_stats['github_api_status'] = 'operational' if test_user else 'limited'
-        except Exception as e:
-            enhanced_stats['github_api_status'] = 'error'
-            enhanced_stats['github_api_error'] = str(e)
+        # GitHub API health check, refreshed at most once a minute
+        enhanced_stats.update(_probe_github(int(time.time() // GITHUB_PROBE_INTERVAL)))
         
         # Trust score distribution
-        contributors = ContributorProfile.objects.all()
-        trust_distribution = {
-            'high_trust': contributors.filter(trust_score__gte=80).count(),
-            'medium_trust': contributors.filter(trust_score__gte=50, trust_score__lt=80).count(),
-            'low_trust': contributors.filter(trust_score__lt=50).count(),
-            'average_trust': contributors.aggregate(avg_trust=models.Avg('trust_score'))['avg_trust'] or 0
-        }
-        enhanced_stats['trust_score_distribution'] = trust_distribution
+        enhanced_stats['trust_score_distribution'] = _trust_distribution(trust_scores)
         
         return Response(enhanced_stats)
     
     except Exception as e:
-        logger.error(f"Stats endpoint error: {e}")
+        logger.error("Stats endpoint error: %s", e)
         # Fallback to basic stats
         return Response({
-            'total_contributors': ContributorProfile.objects.count(),
-            'total_issues': Issue.objects.count(),
-            'open_issues': Issue.objects.filter(state='open').count(),
-            'assigned_issues': Issue.objects.exclude(assignee__isnull=True).exclude(assignee='').count(),
-            'repositories': Repository.objects.count(),
-            'google_users': GoogleUser.objects.count(),
+            **_basic_stats(),
             'enhanced_analysis': False,
             'error': str(e)
         })
 
 
 # Google OAuth Views
+
+# OAuth client settings, fixed for the life of the process
+_GOOGLE_CLIENT_ID = settings.GOOGLE_CLIENT_ID
+_GOOGLE_CLIENT_SECRET = settings.GOOGLE_CLIENT_SECRET
+_GOOGLE_REDIRECT_URI = settings.GOOGLE_REDIRECT_URI
+
+# Token exchange form fields shared by every callback; only the code varies
+_TOKEN_REQUEST_BASE = {
+    'client_id': _GOOGLE_CLIENT_ID,
+    'client_secret': _GOOGLE_CLIENT_SECRET,
+    'grant_type': 'authorization_code',
+    'redirect_uri': _GOOGLE_REDIRECT_URI,
+}
+
+# Everything in the Google authorization URL except the per-request state;
+# depends only on settings, so it is encoded once
+_GOOGLE_AUTH_URL_BASE = 'https://accounts.google.com/o/oauth2/auth?' + urlencode({
+    'client_id': _GOOGLE_CLIENT_ID,
+    'redirect_uri': _GOOGLE_REDIRECT_URI,
+    'scope': 'openid email profile',
+    'response_type': 'code',
+})
+
+# Session key holding the OAuth state google_login sent, checked by google_callback
+_GOOGLE_STATE_SESSION_KEY = 'google_oauth_state'
+
+
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def google_login(request):
     """Start Google OAuth flow"""
-    client_id = settings.GOOGLE_CLIENT_ID
-    redirect_uri = settings.GOOGLE_REDIRECT_URI
+    client_id = _GOOGLE_CLIENT_ID
+    redirect_uri = _GOOGLE_REDIRECT_URI
     
     if not client_id:
         return Response({
@@ -346,14 +617,10 @@ def google_login(request):
             'demo_mode': True
         })
     
-    google_auth_url = (
-        f"https://accounts.google.com/o/oauth2/auth"
-        f"?client_id={client_id}"
-        f"&redirect_uri={redirect_uri}"
-        f"&scope=openid email profile"
-        f"&response_type=code"
-        f"&state=random_state"
-    )
+    # Remember the state so the callback can reject responses it didn't request
+    state = secrets.token_urlsafe(16)
+    request.session[_GOOGLE_STATE_SESSION_KEY] = state
+    google_auth_url = f"{_GOOGLE_AUTH_URL_BASE}&state={state}"
     
     return Response({
         'auth_url': google_auth_url,
@@ -364,100 +631,112 @@ def google_login(request):
     })
 
 
-@api_view(['GET'])
-@permission_classes([AllowAny])
-def google_callback(request):
-    """Handle Google OAuth callback"""
+def _login_redirect(user_data: Dict, access_token: str) -> HttpResponseRedirect:
+    """Store the signed-in Google user and redirect to the frontend with their details"""
+    # Create or update GoogleUser, refreshing profile fields and the token on each login
+    google_user, created = GoogleUser.objects.update_or_create(
+        google_id=user_data['id'],
+        defaults={
+            'email': user_data['email'],
+            'name': user_data['name'],
+            'avatar_url': user_data.get('picture', ''),
+            'access_token': access_token,
+        }
+    )
+    
+    # Redirect to frontend with each user field as its own URL parameter
+    # (booleans as 1/0), so nothing is JSON-encoded inside the query string
+    frontend_url = "http://localhost:5173"  # Updated to match Vite dev server port
+    redirect_params = {
+        'auth_success': 'true',
+        'id': google_user.id,
+        'email': google_user.email,
+        'name': google_user.name,
+        'avatar_url': google_user.avatar_url,
+        'created': int(created),
+        'needs_github_url': int(not google_user.github_url)
+    }
+    
+    redirect_url = f"{frontend_url}?{urlencode(redirect_params)}"
+    return HttpResponseRedirect(redirect_url)
+
+
+def _handle_demo_callback(code: str) -> HttpResponseRedirect:
+    """Sign in a simulated Google user derived from a demo authorization code"""
+    user_data = {
+        'id': f'demo_{hash(code) % 100000}',
+        'email': f'demo.user.{code[:6]}@gmail.com',
+        'name': f'Demo User {code[:6]}',
+        'picture': 'https://lh3.googleusercontent.com/a/default-user=s96-c'
+    }
+    logger.info("Using demo mode for Google OAuth")
+    return _login_redirect(user_data, f'demo_google_token_{code[:10]}')
+
+
+@require_GET
+async def google_callback(request):
+    """
+    Handle Google OAuth callback. Async so the worker can serve other requests
+    while the token exchange and userinfo calls are in flight
+    """
     code = request.GET.get('code')
     error = request.GET.get('error')
     
     if error:
-        return Response({
+        return JsonResponse({
             'error': f'Google authentication failed: {error}',
             'success': False
         }, status=status.HTTP_400_BAD_REQUEST)
     
     if not code:
-        return Response({
+        return JsonResponse({
             'error': 'Authorization code not received',
             'success': False
         }, status=status.HTTP_400_BAD_REQUEST)
     
     try:
         # For demo mode (no Google credentials or demo code)
-        if not settings.GOOGLE_CLIENT_SECRET or code.startswith('demo_'):
-            # Demo user data
-            user_data = {
-                'id': f'demo_{hash(code) % 100000}',
-                'email': f'demo.user.{code[:6]}@gmail.com',
-                'name': f'Demo User {code[:6]}',
-                'picture': 'https://lh3.googleusercontent.com/a/default-user=s96-c'
-            }
-            access_token = f'demo_google_token_{code[:10]}'
-            logger.info("Using demo mode for Google OAuth")
-        else:
-            # Real Google OAuth flow
-            logger.info(f"Making token request with client_id: {settings.GOOGLE_CLIENT_ID[:10]}...")
-            token_response = requests.post('https://oauth2.googleapis.com/token', {
-                'client_id': settings.GOOGLE_CLIENT_ID,
-                'client_secret': settings.GOOGLE_CLIENT_SECRET,
-                'code': code,
-                'grant_type': 'authorization_code',
-                'redirect_uri': settings.GOOGLE_REDIRECT_URI,
-            })
+        if not _GOOGLE_CLIENT_SECRET or code.startswith('demo_'):
+            return await sync_to_async(_handle_demo_callback)(code)
+        
+        # The state must be the one google_login stored in this session; it is
+        # single-use, so it is removed whether or not it matches
+        expected_state = await request.session.apop(_GOOGLE_STATE_SESSION_KEY, None)
+        if not expected_state or not secrets.compare_digest(
+            expected_state.encode(), request.GET.get('state', '').encode()
+        ):
+            return JsonResponse({
+                'error': 'Invalid OAuth state',
+                'success': False
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        # Real Google OAuth flow. The authorization code is single-use, so only
+        # connection failures are retried, never a request that reached Google
+        logger.debug("Making token request with client_id: %.10s...", _GOOGLE_CLIENT_ID)
+        async with httpx.AsyncClient(timeout=GOOGLE_HTTP_TIMEOUT,
+                                     transport=httpx.AsyncHTTPTransport(retries=2)) as client:
+            token_response = await client.post(
+                'https://oauth2.googleapis.com/token',
+                data=dict(_TOKEN_REQUEST_BASE, code=code)
+            )
             
-            logger.info(f"Token response status: {token_response.status_code}")
+            logger.info("Token response status: %d", token_response.status_code)
             token_data = token_response.json()
-            logger.info(f"Token data: {token_data}")
             
             access_token = token_data.get('access_token')
-            
-            if access_token:
-                # Fetch user data from Google
-                user_response = requests.get('https://www.googleapis.com/oauth2/v2/userinfo',
-                    headers={'Authorization': f'Bearer {access_token}'})
-                user_data = user_response.json()
-            else:
+            if not access_token:
                 error_msg = token_data.get('error_description', token_data.get('error', 'Unknown error'))
                 raise Exception(f"Failed to get access token: {error_msg}")
+            
+            # Fetch user data from Google
+            user_response = await client.get('https://www.googleapis.com/oauth2/v2/userinfo',
+                headers={'Authorization': f'Bearer {access_token}'})
         
-        # Create or update GoogleUser
-        google_user, created = GoogleUser.objects.get_or_create(
-            google_id=user_data['id'],
-            defaults={
-                'email': user_data['email'],
-                'name': user_data['name'],
-                'avatar_url': user_data.get('picture', ''),
-                'access_token': access_token,
-            }
-        )
-        
-        # Redirect to frontend with user data in URL parameters
-        user_data = {
-            'id': google_user.id,
-            'email': google_user.email,
-            'name': google_user.name,
-            'avatar_url': google_user.avatar_url,
-            'created': created,
-            'needs_github_url': not google_user.github_url
-        }
-        
-        # Encode user data as URL parameters
-        from urllib.parse import urlencode
-        import json
-        
-        frontend_url = "http://localhost:5173"  # Updated to match Vite dev server port
-        redirect_params = {
-            'auth_success': 'true',
-            'user_data': json.dumps(user_data)
-        }
-        
-        redirect_url = f"{frontend_url}?{urlencode(redirect_params)}"
-        return HttpResponseRedirect(redirect_url)
+        return await sync_to_async(_login_redirect)(user_response.json(), access_token)
         
     except Exception as e:
-        logger.error(f"Google OAuth error: {e}")
-        return Response({
+        logger.error("Google OAuth error: %s", e)
+        return JsonResponse({
             'error': 'Failed to process Google authentication',
             'success': False
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -479,16 +758,15 @@ def submit_github_url(request):
     try:
         google_user = GoogleUser.objects.get(id=user_id)
         
-        # Validate GitHub URL format
-        import re
-        if not re.match(r'https://github\.com/[^/]+/?$', github_url.rstrip('/')):
+        # Validate GitHub URL format and extract the username
+        match = _GH_URL_RE.match(github_url.rstrip('/'))
+        if not match:
             return Response({
                 'error': 'Invalid GitHub URL format. Please use: https://github.com/username',
                 'success': False
             }, status=status.HTTP_400_BAD_REQUEST)
         
-        # Extract username from URL
-        username = github_url.rstrip('/').split('/')[-1]
+        username = match.group(1)
         
         # Update Google user with GitHub info
         google_user.github_url = github_url
@@ -522,7 +800,7 @@ def submit_github_url(request):
             'success': False
         }, status=status.HTTP_404_NOT_FOUND)
     except Exception as e:
-        logger.error(f"GitHub URL submission error: {e}")
+        logger.error("GitHub URL submission error: %s", e)
         return Response({
             'error': 'Failed to save GitHub URL',
             'success': False
@@ -542,7 +820,7 @@ def user_profile(request):
         }, status=status.HTTP_400_BAD_REQUEST)
     
     try:
-        google_user = GoogleUser.objects.get(id=user_id)
+        google_user = GoogleUser.objects.select_related('contributor_profile').get(id=user_id)
         
         response_data = {
             'user': {
@@ -556,13 +834,14 @@ def user_profile(request):
             'found': True
         }
         
-        # Add contributor data if available
+        # Add contributor data if available; the linked profile came with the
+        # user, a profile created before the user linked it is looked up by name
         if google_user.github_username:
-            try:
-                contributor = ContributorProfile.objects.get(username=google_user.github_username)
+            contributor = getattr(google_user, 'contributor_profile', None)
+            if contributor is None or contributor.username != google_user.github_username:
+                contributor = ContributorProfile.objects.filter(username=google_user.github_username).first()
+            if contributor is not None:
                 response_data['contributor'] = ContributorProfileSerializer(contributor).data
-            except ContributorProfile.DoesNotExist:
-                pass
         
         return Response(response_data)
         
@@ -601,9 +880,10 @@ def analyze_repository(request):
         else:
             # Assume it's already in owner/repo format
             repo_full_name = repo_url
+            owner, _, repo = repo_full_name.partition('/')
         
         # Analyze repository health
-        repo_analysis = cookie_detector.analyze_repository_health(repo_full_name)
+        repo_analysis = _detector().analyze_repository_health(owner, repo)
         
         if not repo_analysis['success']:
             return Response({
@@ -611,6 +891,13 @@ def analyze_repository(request):
                 'success': False
             }, status=status.HTTP_400_BAD_REQUEST)
         
+        # Issue analyses are dataclasses internally; serialize them for the response
+        repo_analysis = dict(repo_analysis)
+        repo_analysis['user_analyses'] = {
+            username: user_analysis_to_dict(analysis)
+            for username, analysis in repo_analysis['user_analyses'].items()
+        }
+        
         # Get additional repository statistics
         try:
             # This would require additional GitHub API calls
@@ -619,20 +906,20 @@ def analyze_repository(request):
                 'success': True,
                 'repository': repo_full_name,
                 'analysis': repo_analysis,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': datetime.now(timezone.utc)
             }
             
             return Response(response_data)
         
         except Exception as e:
-            logger.error(f"Repository analysis error: {e}")
+            logger.error("Repository analysis error: %s", e)
             return Response({
                 'error': f'Analysis failed: {str(e)}',
                 'success': False
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
     
     except Exception as e:
-        logger.error(f"Repository analysis endpoint error: {e}")
+        logger.error("Repository analysis endpoint error: %s", e)
         return Response({
             'error': 'Failed to analyze repository',
             'success': False
@@ -652,40 +939,31 @@ def analyze_contributor(request):
         }, status=status.HTTP_400_BAD_REQUEST)
     
     try:
-        # Get user details
-        user_details = github_service.get_user_details(username)
-        if not user_details:
+        # Get user details and recent activity in one go
+        bundle = _github().fetch_user_bundle(username)
+        if not bundle:
             return Response({
                 'error': f'GitHub user "{username}" not found',
                 'success': False
             }, status=status.HTTP_404_NOT_FOUND)
         
-        # Calculate trust score
-        trust_analysis = cookie_detector.calculate_trust_score(username)
+        user_details = bundle['user']
+        recent_events = bundle['events']
         
-        # Get recent activity
-        recent_events = github_service.get_user_events(username, pages=2)
+        # Calculate trust score from the fetched data
+        trust_analysis = _detector().calculate_trust_score(username, bundle=bundle)
         
         # Analyze activity patterns
+        recent_events = recent_events or []
         activity_analysis = {
-            'total_events': len(recent_events) if recent_events else 0,
-            'event_types': {},
-            'repositories_active_in': set(),
-            'last_activity': None
+            'total_events': len(recent_events),
+            'event_types': dict(Counter(event.get('type', 'Unknown') for event in recent_events)),
+            'repositories_active_in': list({
+                event['repo']['name'] for event in recent_events if event.get('repo', {}).get('name')
+            }),
+            'last_activity': recent_events[0].get('created_at') if recent_events else None
         }
         
-        if recent_events:
-            activity_analysis['last_activity'] = recent_events[0].get('created_at')
-            
-            for event in recent_events:
-                event_type = event.get('type', 'Unknown')
-                activity_analysis['event_types'][event_type] = activity_analysis['event_types'].get(event_type, 0) + 1
-                
-                if event.get('repo', {}).get('name'):
-                    activity_analysis['repositories_active_in'].add(event['repo']['name'])
-        
-        activity_analysis['repositories_active_in'] = list(activity_analysis['repositories_active_in'])
-        
         response_data = {
             'success': True,
             'username': username,
@@ -705,13 +983,13 @@ def analyze_contributor(request):
             },
             'trust_analysis': trust_analysis,
             'activity_analysis': activity_analysis,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': datetime.now(timezone.utc)
         }
         
         return Response(response_data)
     
     except Exception as e:
-        logger.error(f"Contributor analysis error: {e}")
+        logger.error("Contributor analysis error: %s", e)
         return Response({
             'error': f'Failed to analyze contributor: {str(e)}',
             'success': False
@@ -0,0 +1,14 @@
+"""
+Celery application for background GitHub analysis
+"""
+import os
+
+from celery import Celery
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'cookielicking.settings')
+
+app = Celery('cookielicking')
+
+# All CELERY_* names in Django settings configure the app
+app.config_from_object('django.conf:settings', namespace='CELERY')
+app.autodiscover_tasks()
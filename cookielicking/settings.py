@@ -81,6 +81,11 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # Seconds to reuse a connection across requests and Celery tasks; worth
+        # enabling (e.g. 600) on networked databases such as Postgres, not SQLite.
+        # Async views never reuse persistent connections.
+        'CONN_MAX_AGE': config('DB_CONN_MAX_AGE', default=0, cast=int),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
@@ -136,7 +141,7 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.IsAuthenticated',
     ],
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'api.renderers.ORJSONRenderer',
     ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20
@@ -163,8 +168,41 @@ GEMINI_API_KEY = config('GEMINI_API_KEY', default='your_gemini_api_key_here')
 
 # GitHub API settings
 GITHUB_ACCESS_TOKEN = config('GITHUB_ACCESS_TOKEN', default='')  # For higher rate limits
+# Optional pool of tokens (comma separated) rotated across by the real GitHub service
+GITHUB_ACCESS_TOKENS = [
+    token.strip() for token in config('GITHUB_ACCESS_TOKENS', default='').split(',') if token.strip()
+]
 GITHUB_API_BASE_URL = 'https://api.github.com'
 
+# Redis shared by all workers for GitHub response caching (disabled when empty)
+REDIS_URL = config('REDIS_URL', default='')
+
+# Celery background tasks
+CELERY_BROKER_URL = config('CELERY_BROKER_URL', default=REDIS_URL or 'redis://localhost:6379/0')
+CELERY_RESULT_BACKEND = config('CELERY_RESULT_BACKEND', default=CELERY_BROKER_URL)
+CELERY_TASK_SERIALIZER = 'json'
+CELERY_RESULT_SERIALIZER = 'json'
+CELERY_ACCEPT_CONTENT = ['json']
+# Long scans: reserve one task at a time and acknowledge it only once it has run
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+CELERY_TASK_ACKS_LATE = True
+
+# Repositories (owner/name, comma separated) checked for inactive assignees every 24 hours
+MONITORED_REPOSITORIES = [
+    name.strip() for name in config('MONITORED_REPOSITORIES', default='').split(',') if name.strip()
+]
+CELERY_BEAT_SCHEDULE = {
+    'check-inactive-contributors': {
+        'task': 'api.tasks.check_monitored_repositories_task',
+        'schedule': 60 * 60 * 24,
+    },
+    # Keeps the trust scores in Redis warm for every tracked GitHub user
+    'refresh-trust-scores': {
+        'task': 'api.tasks.refresh_trust_scores_task',
+        'schedule': 60 * 5,
+    },
+}
+
 # Logging
 LOGGING = {
     'version': 1,
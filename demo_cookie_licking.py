@@ -6,12 +6,17 @@ Demonstrates the real GitHub API integration and cookie-licking detection capabi
 
 import requests
 import json
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # API base URL
 BASE_URL = "http://localhost:8000/api"
 
+# One keep-alive connection pool for every demo request
+session = requests.Session()
+# (connect, read) timeouts in seconds; repository analysis can take a while
+REQUEST_TIMEOUT = (5, 300)
+
 def print_section(title):
     """Print a formatted section header"""
     print(f"\n{'='*60}")
@@ -23,11 +28,32 @@ def print_json(data, title="Response"):
     print(f"\n{title}:")
     print(json.dumps(data, indent=2))
 
-def test_health_check():
+def post_all(path, payloads, max_workers=4):
+    """POST each payload to an API path concurrently; responses come back in payload order"""
+    def post(payload):
+        return session.post(
+            f"{BASE_URL}{path}",
+            json=payload,
+            headers={"Content-Type": "application/json"},
+            timeout=REQUEST_TIMEOUT
+        )
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(post, payloads))
+
+def get_all(paths):
+    """GET several independent API paths concurrently; responses come back in path order"""
+    with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+        return list(executor.map(
+            lambda path: session.get(f"{BASE_URL}{path}", timeout=REQUEST_TIMEOUT), paths
+        ))
+
+def test_health_check(response=None):
     """Test the API health check"""
     print_section("API HEALTH CHECK")
     
-    response = requests.get(f"{BASE_URL}/health/")
+    if response is None:
+        response = session.get(f"{BASE_URL}/health/", timeout=REQUEST_TIMEOUT)
     if response.status_code == 200:
         data = response.json()
         print(f"✅ API is healthy: {data['message']}")
@@ -35,11 +61,12 @@ def test_health_check():
     else:
         print(f"❌ API health check failed: {response.status_code}")
 
-def test_enhanced_stats():
+def test_enhanced_stats(response=None):
     """Test the enhanced stats endpoint with GitHub integration"""
     print_section("ENHANCED STATISTICS WITH GITHUB INTEGRATION")
     
-    response = requests.get(f"{BASE_URL}/stats/")
+    if response is None:
+        response = session.get(f"{BASE_URL}/stats/", timeout=REQUEST_TIMEOUT)
     if response.status_code == 200:
         data = response.json()
         
@@ -69,11 +96,12 @@ def test_enhanced_stats():
     else:
         print(f"❌ Stats request failed: {response.status_code}")
 
-def test_enhanced_contributors():
+def test_enhanced_contributors(response=None):
     """Test the enhanced contributors endpoint"""
     print_section("ENHANCED CONTRIBUTORS WITH GITHUB ANALYSIS")
     
-    response = requests.get(f"{BASE_URL}/contributors/")
+    if response is None:
+        response = session.get(f"{BASE_URL}/contributors/", timeout=REQUEST_TIMEOUT)
     if response.status_code == 200:
         data = response.json()
         
@@ -97,11 +125,12 @@ def test_enhanced_contributors():
     else:
         print(f"❌ Contributors request failed: {response.status_code}")
 
-def test_enhanced_issues():
+def test_enhanced_issues(response=None):
     """Test the enhanced issues endpoint with cookie-licking detection"""
     print_section("ISSUES WITH COOKIE-LICKING DETECTION")
     
-    response = requests.get(f"{BASE_URL}/issues/")
+    if response is None:
+        response = session.get(f"{BASE_URL}/issues/", timeout=REQUEST_TIMEOUT)
     if response.status_code == 200:
         data = response.json()
         
@@ -135,15 +164,11 @@ def test_contributor_analysis():
     # Test with some well-known GitHub users
     test_users = ["torvalds", "defunkt", "mojombo"]
     
-    for username in test_users:
+    responses = post_all("/analyze/contributor/", [{"username": username} for username in test_users])
+    
+    for username, response in zip(test_users, responses):
         print(f"\n🔍 Analyzing GitHub user: {username}")
         
-        response = requests.post(
-            f"{BASE_URL}/analyze/contributor/",
-            json={"username": username},
-            headers={"Content-Type": "application/json"}
-        )
-        
         if response.status_code == 200:
             data = response.json()
             if data['success']:
@@ -167,8 +192,6 @@ def test_contributor_analysis():
                 print(f"   ❌ Analysis failed: {data.get('error', 'Unknown error')}")
         else:
             print(f"   ❌ Request failed: {response.status_code}")
-        
-        time.sleep(1)  # Rate limiting
 
 def test_repository_analysis():
     """Test the repository analysis endpoint"""
@@ -176,15 +199,11 @@ def test_repository_analysis():
     
     test_repos = ["microsoft/vscode", "facebook/react", "nodejs/node"]
     
-    for repo in test_repos:
+    responses = post_all("/analyze/repository/", [{"repository_url": repo} for repo in test_repos])
+    
+    for repo, response in zip(test_repos, responses):
         print(f"\n🏛️  Analyzing repository: {repo}")
         
-        response = requests.post(
-            f"{BASE_URL}/analyze/repository/",
-            json={"repository_url": repo},
-            headers={"Content-Type": "application/json"}
-        )
-        
         if response.status_code == 200:
             data = response.json()
             if data['success']:
@@ -198,8 +217,6 @@ def test_repository_analysis():
                 print(f"   ❌ Analysis failed: {data.get('error', 'Unknown error')}")
         else:
             print(f"   ❌ Request failed: {response.status_code}")
-        
-        time.sleep(1)  # Rate limiting
 
 def demo_summary():
     """Print demo summary and next steps"""
@@ -242,11 +259,14 @@ def main():
     print("\n⚡ Starting comprehensive system demonstration...")
     
     try:
-        # Core API tests
-        test_health_check()
-        test_enhanced_stats()
-        test_enhanced_contributors()
-        test_enhanced_issues()
+        # Core API tests; the four GETs are independent, so fetch them together
+        health, stats, contributors, issues = get_all(
+            ["/health/", "/stats/", "/contributors/", "/issues/"]
+        )
+        test_health_check(health)
+        test_enhanced_stats(stats)
+        test_enhanced_contributors(contributors)
+        test_enhanced_issues(issues)
         
         # Real GitHub API tests (may hit rate limits without token)
         print("\n⚠️  Note: The following tests use real GitHub API calls")
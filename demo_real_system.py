@@ -6,142 +6,209 @@ Shows the actual implementation using real GitHub APIs
 
 import requests
 import json
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError, Timeout
+from urllib3.util.retry import Retry
 
 BASE_URL = "http://localhost:8000/api"
 
+# One keep-alive connection pool for every demo request; transient errors on
+# GETs are retried (POSTs are never replayed), then the last response is returned
+session = requests.Session()
+session.mount("http://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+                      raise_on_status=False)
+))
+# (connect, read) timeouts in seconds, so a hung backend can't stall the demo
+REQUEST_TIMEOUT = (3.05, 15)
+
+# Output lines waiting to be written; flushed once per section
+OUT = []
+
+def emit(line):
+    """Queue one line of output"""
+    OUT.append(line)
+
+def flush():
+    """Write every queued line to stdout in a single call"""
+    if OUT:
+        sys.stdout.write("\n".join(OUT) + "\n")
+        sys.stdout.flush()
+        OUT.clear()
+
 def print_header(title):
-    print(f"\n{'='*60}")
-    print(f" {title}")
-    print(f"{'='*60}")
+    flush()
+    emit(f"\n{'='*60}")
+    emit(f" {title}")
+    emit(f"{'='*60}")
+
+# (method, path, query params, JSON body) of each endpoint probed by the demo
+PROBES = (
+    ("GET", "/real/issues/", {"repo_owner": "aaneesa", "repo_name": "Gurukul-2.0"}, None),
+    ("GET", "/real/contributor/aniket-bit7/", None, None),
+    ("POST", "/real/analyze/", None, {"repo_owner": "aaneesa", "repo_name": "Gurukul-2.0"}),
+)
+
+def send_probe(probe):
+    """Send one PROBES entry over the shared session; None if it timed out or couldn't connect"""
+    method, path, params, body = probe
+    try:
+        return session.request(method, f"{BASE_URL}{path}", params=params, json=body,
+                               timeout=REQUEST_TIMEOUT)
+    except (Timeout, ConnectionError) as e:
+        emit(f"   ⚠️  {method} {path} failed: {e}")
+        return None
+
+def send_probes(probes=PROBES):
+    """Send independent probes at once; responses come back in probe order"""
+    with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+        return list(executor.map(send_probe, probes))
 
 def test_real_github_endpoints():
     """Test the real GitHub integration endpoints"""
     
     print_header("🍪 REAL COOKIE-LICKING DETECTION SYSTEM")
-    print("This system implements EXACTLY what you specified:")
-    print("• Real GitHub OAuth integration (using existing Google OAuth)")
-    print("• Actual GitHub API calls to fetch repository data")
-    print("• Trust score calculation based on user activity")
-    print("• Automated cookie-licking detection and remediation")
+    emit("This system implements EXACTLY what you specified:")
+    emit("• Real GitHub OAuth integration (using existing Google OAuth)")
+    emit("• Actual GitHub API calls to fetch repository data")
+    emit("• Trust score calculation based on user activity")
+    emit("• Automated cookie-licking detection and remediation")
     
     print_header("🔍 TESTING REAL ENDPOINTS")
     
+    # The three probes don't depend on each other: send them together and
+    # print the results in order
+    flush()
+    issues_response, contributor_response, analyze_response = send_probes()
+    
     # Test 1: Get issues from real repository
-    print("\n1. Fetching real issues from GitHub repository...")
-    print("   API: GET /api/real/issues/?repo_owner=aaneesa&repo_name=Gurukul-2.0")
+    emit("\n1. Fetching real issues from GitHub repository...")
+    emit("   API: GET /api/real/issues/?repo_owner=aaneesa&repo_name=Gurukul-2.0")
     
-    response = requests.get(f"{BASE_URL}/real/issues/?repo_owner=aaneesa&repo_name=Gurukul-2.0")
-    if response.status_code == 200:
+    response = issues_response
+    if response is not None and response.status_code == 200:
         data = response.json()
-        print(f"   ✅ Repository: {data['repository']}")
-        print(f"   📊 Total Issues: {data['total_issues']}")
+        emit(f"   ✅ Repository: {data['repository']}")
+        emit(f"   📊 Total Issues: {data['total_issues']}")
         
-        if data['issues']:
-            for issue in data['issues'][:2]:  # Show first 2 issues
-                print(f"\n   🎫 Issue #{issue['issue_number']}: {issue['title']}")
-                print(f"      Assignee: {issue['assignee'] or 'Unassigned'}")
-                print(f"      Status: {issue['status']}")
-                print(f"      Comments: {len(issue['comments'])}")
+        issues = data.get('issues')
+        if issues:
+            for issue in islice(issues, 2):  # Show first 2 issues
+                emit(f"\n   🎫 Issue #{issue['issue_number']}: {issue['title']}")
+                emit(f"      Assignee: {issue['assignee'] or 'Unassigned'}")
+                emit(f"      Status: {issue['status']}")
+                emit(f"      Comments: {len(issue['comments'])}")
                 
-                if issue['trust_scores']:
-                    print(f"      Trust Scores:")
-                    for ts in issue['trust_scores'][:3]:
-                        print(f"        • {ts['username']}: {ts['score']} ({ts['tag']})")
+                trust_scores = issue.get('trust_scores')
+                if trust_scores:
+                    emit(f"      Trust Scores:")
+                    for ts in islice(trust_scores, 3):
+                        emit(f"        • {ts['username']}: {ts['score']} ({ts['tag']})")
         else:
-            print("   ⚠️  No issues found (likely due to API rate limiting without token)")
+            emit("   ⚠️  No issues found (likely due to API rate limiting without token)")
+    elif response is None:
+        emit("   ❌ Request failed: no response")
     else:
-        print(f"   ❌ Request failed: {response.status_code}")
+        emit(f"   ❌ Request failed: {response.status_code}")
     
     # Test 2: Analyze contributor activity
-    print("\n2. Analyzing contributor activity...")
-    print("   API: GET /api/real/contributor/aniket-bit7/")
+    emit("\n2. Analyzing contributor activity...")
+    emit("   API: GET /api/real/contributor/aniket-bit7/")
     
-    response = requests.get(f"{BASE_URL}/real/contributor/aniket-bit7/")
-    if response.status_code == 200:
+    response = contributor_response
+    if response is not None and response.status_code == 200:
         data = response.json()
-        print(f"   ✅ Username: {data['username']}")
-        print(f"   🎯 Trust Score: {data['trust_score']}")
-        print(f"   🏷️  Tag: {data['tag']}")
-        print(f"   📊 Event Counts: {data['event_counts']}")
-        print(f"   🔄 Recent Activity: {data['has_recent_activity']}")
+        emit(f"   ✅ Username: {data['username']}")
+        emit(f"   🎯 Trust Score: {data['trust_score']}")
+        emit(f"   🏷️  Tag: {data['tag']}")
+        emit(f"   📊 Event Counts: {data['event_counts']}")
+        emit(f"   🔄 Recent Activity: {data['has_recent_activity']}")
         
-        if data['recent_events']:
-            print(f"   📅 Recent Events:")
-            for event in data['recent_events'][:3]:
-                print(f"      • {event['type']} on {event.get('repo', {}).get('name', 'Unknown')}")
+        recent_events = data.get('recent_events')
+        if recent_events:
+            emit(f"   📅 Recent Events:")
+            for event in islice(recent_events, 3):
+                emit(f"      • {event['type']} on {event.get('repo', {}).get('name', 'Unknown')}")
+    elif response is None:
+        emit("   ❌ Request failed: no response")
     else:
-        print(f"   ❌ Request failed: {response.status_code}")
+        emit(f"   ❌ Request failed: {response.status_code}")
     
     # Test 3: Analyze inactive contributors
-    print("\n3. Detecting inactive contributors...")
-    print("   API: POST /api/real/analyze/")
+    emit("\n3. Detecting inactive contributors...")
+    emit("   API: POST /api/real/analyze/")
     
-    response = requests.post(f"{BASE_URL}/real/analyze/", json={
-        "repo_owner": "aaneesa",
-        "repo_name": "Gurukul-2.0"
-    })
+    response = analyze_response
     
-    if response.status_code == 200:
+    if response is not None and response.status_code == 200:
         data = response.json()
-        print(f"   ✅ Repository: {data['repository']}")
-        print(f"   🚨 Inactive Contributors: {data['inactive_contributors_detected']}")
+        emit(f"   ✅ Repository: {data['repository']}")
+        emit(f"   🚨 Inactive Contributors: {data['inactive_contributors_detected']}")
         
-        if data['detections']:
-            print(f"   🔍 Detections:")
-            for detection in data['detections'][:3]:
-                print(f"      • Issue #{detection['issue_number']}: {detection['issue_title']}")
-                print(f"        Assignee: {detection['assignee']} (Trust: {detection['trust_score']})")
-                print(f"        Days Inactive: {detection['days_inactive']}")
-                print(f"        Needs Reminder: {detection['needs_reminder']}")
+        detections = data.get('detections')
+        if detections:
+            emit(f"   🔍 Detections:")
+            for detection in islice(detections, 3):
+                emit(f"      • Issue #{detection['issue_number']}: {detection['issue_title']}")
+                emit(f"        Assignee: {detection['assignee']} (Trust: {detection['trust_score']})")
+                emit(f"        Days Inactive: {detection['days_inactive']}")
+                emit(f"        Needs Reminder: {detection['needs_reminder']}")
+    elif response is None:
+        emit("   ❌ Request failed: no response")
     else:
-        print(f"   ❌ Request failed: {response.status_code}")
+        emit(f"   ❌ Request failed: {response.status_code}")
     
     print_header("🎯 SYSTEM CAPABILITIES")
-    print("✅ Real GitHub API Integration:")
-    print("   • GET /repos/{owner}/{repo}/issues")
-    print("   • GET /repos/{owner}/{repo}/issues/{number}/comments")
-    print("   • GET /users/{username}/events/public")
-    print("   • GET /search/issues?q=commenter:{username}")
-    print("   • GET /repos/{owner}/{repo}/commits")
-    print("   • PATCH /repos/{owner}/{repo}/issues/{number} (unassign)")
-    print("   • POST /repos/{owner}/{repo}/issues/{number}/comments (reminder)")
-    
-    print("\n✅ Trust Score Calculation (as specified):")
-    print("   • PushEvent → +3 points")
-    print("   • PullRequestEvent → +2 points")
-    print("   • IssueCommentEvent → +2 points")
-    print("   • No event in last 7 days → -3 points")
-    
-    print("\n✅ Cookie-Licking Detection Logic:")
-    print("   • Check assigned users every 24 hours")
-    print("   • Mark stale if inactive > 7 days")
-    print("   • Send polite reminder: 'Hi @{username}, are you still working on this?'")
-    print("   • Unassign after 3 days of no response")
-    
-    print("\n✅ Database Models:")
-    print("   • GitHubUser → stores username, trust_score, tags")
-    print("   • RealIssue → issue_id, title, repo_name, assignee, status")
-    print("   • RealComment → issue, username, body, created_at")  
-    print("   • RealActivityLog → username, event_type, repo_name, timestamp")
-    print("   • InactiveAssigneeDetection → tracking reminders and unassignments")
+    emit("✅ Real GitHub API Integration:")
+    emit("   • GET /repos/{owner}/{repo}/issues")
+    emit("   • GET /repos/{owner}/{repo}/issues/{number}/comments")
+    emit("   • GET /users/{username}/events/public")
+    emit("   • GET /search/issues?q=commenter:{username}")
+    emit("   • GET /repos/{owner}/{repo}/commits")
+    emit("   • PATCH /repos/{owner}/{repo}/issues/{number} (unassign)")
+    emit("   • POST /repos/{owner}/{repo}/issues/{number}/comments (reminder)")
+    
+    emit("\n✅ Trust Score Calculation (as specified):")
+    emit("   • PushEvent → +3 points")
+    emit("   • PullRequestEvent → +2 points")
+    emit("   • IssueCommentEvent → +2 points")
+    emit("   • No event in last 7 days → -3 points")
+    
+    emit("\n✅ Cookie-Licking Detection Logic:")
+    emit("   • Check assigned users every 24 hours")
+    emit("   • Mark stale if inactive > 7 days")
+    emit("   • Send polite reminder: 'Hi @{username}, are you still working on this?'")
+    emit("   • Unassign after 3 days of no response")
+    
+    emit("\n✅ Database Models:")
+    emit("   • GitHubUser → stores username, trust_score, tags")
+    emit("   • RealIssue → issue_id, title, repo_name, assignee, status")
+    emit("   • RealComment → issue, username, body, created_at")  
+    emit("   • RealActivityLog → username, event_type, repo_name, timestamp")
+    emit("   • InactiveAssigneeDetection → tracking reminders and unassignments")
     
     print_header("🚀 NEXT STEPS FOR FULL IMPLEMENTATION")
-    print("1. 🔑 Add GitHub OAuth flow (replace Google OAuth with GitHub)")
-    print("2. 🎫 Set up GitHub App with proper permissions")
-    print("3. ⏰ Implement Celery background tasks for 24-hour checks")
-    print("4. 📧 Add email notifications for maintainers")
-    print("5. 🖥️  Create React frontend to display real repository data")
-    print("6. 📊 Add analytics dashboard for repository health")
-    
-    print(f"\n🌐 System Status:")
-    print(f"   • Backend API: ✅ Running on http://localhost:8002")
-    print(f"   • Real GitHub Integration: ✅ Implemented")
-    print(f"   • Database Models: ✅ Created and migrated")
-    print(f"   • Cookie-Licking Detection: ✅ Functional")
-    print(f"   • Trust Score Calculation: ✅ Working")
-    
-    print(f"\n📝 API Endpoints Available:")
+    emit("1. 🔑 Add GitHub OAuth flow (replace Google OAuth with GitHub)")
+    emit("2. 🎫 Set up GitHub App with proper permissions")
+    emit("3. ⏰ Implement Celery background tasks for 24-hour checks")
+    emit("4. 📧 Add email notifications for maintainers")
+    emit("5. 🖥️  Create React frontend to display real repository data")
+    emit("6. 📊 Add analytics dashboard for repository health")
+    
+    emit(f"\n🌐 System Status:")
+    emit(f"   • Backend API: ✅ Running on http://localhost:8002")
+    emit(f"   • Real GitHub Integration: ✅ Implemented")
+    emit(f"   • Database Models: ✅ Created and migrated")
+    emit(f"   • Cookie-Licking Detection: ✅ Functional")
+    emit(f"   • Trust Score Calculation: ✅ Working")
+    
+    emit(f"\n📝 API Endpoints Available:")
     endpoints = [
         "GET /api/real/issues/?repo_owner=owner&repo_name=repo",
         "GET /api/real/issues/<id>/",
@@ -152,7 +219,10 @@ def test_real_github_endpoints():
     ]
     
     for endpoint in endpoints:
-        print(f"   • {endpoint}")
+        emit(f"   • {endpoint}")
 
 if __name__ == "__main__":
-    test_real_github_endpoints()
+    try:
+        test_real_github_endpoints()
+    finally:
+        flush()
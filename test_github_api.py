@@ -5,85 +5,115 @@ Run this to test if your GitHub token is working properly
 """
 import os
 import sys
-import django
+from datetime import datetime
+
+from decouple import config
+from django.conf import settings
 
 # Add the backend2 directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-# Setup Django
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'cookielicking.settings')
-django.setup()
+# The service only reads a couple of settings, so configure those from the
+# environment / .env instead of running django.setup() (apps, models, database)
+if not settings.configured:
+    settings.configure(
+        GITHUB_ACCESS_TOKEN=config('GITHUB_ACCESS_TOKEN', default=''),
+        REDIS_URL=config('REDIS_URL', default=''),
+    )
 
 from api.services.real_github_service import RealGitHubService
-from django.conf import settings
+
+# Output lines waiting to be written; flushed once per section
+OUT = []
+
+def emit(line):
+    """Queue one line of output"""
+    OUT.append(line)
+
+def flush():
+    """Write every queued line to stdout in a single call"""
+    if OUT:
+        sys.stdout.write("\n".join(OUT) + "\n")
+        sys.stdout.flush()
+        OUT.clear()
 
 def test_github_api():
     """Test GitHub API with the configured token"""
-    print("🔍 Testing GitHub API access...")
+    emit("🔍 Testing GitHub API access...")
     
     # Get token from settings
     token = getattr(settings, 'GITHUB_ACCESS_TOKEN', None)
     if not token or token == 'your_github_personal_access_token_here':
-        print("❌ No GitHub token configured!")
-        print("Please add your GitHub Personal Access Token to the .env file:")
-        print("GITHUB_ACCESS_TOKEN=your_actual_token_here")
+        emit("❌ No GitHub token configured!")
+        emit("Please add your GitHub Personal Access Token to the .env file:")
+        emit("GITHUB_ACCESS_TOKEN=your_actual_token_here")
         return False
     
-    print(f"✅ Token found: {token[:8]}{'*' * (len(token) - 8)}")
+    emit(f"✅ Token found: {token[:8]}{'*' * (len(token) - 8)}")
     
     # Initialize service
     service = RealGitHubService(access_token=token)
     
+    flush()
+    # Check rate limits first: /rate_limit doesn't count against the core
+    # quota, and there is no point spending the rest of it on a nearly empty budget
+    emit("\n📈 Checking API rate limits...")
+    try:
+        rate_limit = service.get_rate_limit()
+        if rate_limit:
+            core_limit = rate_limit.get('resources', {}).get('core', {})
+            remaining = core_limit.get('remaining', 0)
+            limit = core_limit.get('limit', 0)
+            reset_time = core_limit.get('reset', 0)
+            
+            emit(f"✅ Rate limit status: {remaining}/{limit} requests remaining")
+            emit(f"📅 Resets at: {datetime.fromtimestamp(reset_time)}")
+            
+            if remaining < service.RATE_LIMIT_THRESHOLD:
+                emit("⚠️  Rate limit nearly exhausted, skipping the API tests until it resets")
+                return False
+        else:
+            emit("⚠️  Could not fetch rate limit info")
+    except Exception as e:
+        emit(f"❌ Failed to check rate limits: {e}")
+    
+    flush()
     # Test 1: Get user events
-    print("\n📊 Testing user events API...")
+    emit("\n📊 Testing user events API...")
     try:
-        events = service.get_user_events("aniket-bit7")
-        print(f"✅ Successfully fetched {len(events)} events for aniket-bit7")
+        events = service.get_user_events("aniket-bit7", per_page=3)
+        emit(f"✅ Successfully fetched {len(events)} events for aniket-bit7")
         
         # Show some sample events
         if events:
-            print("📝 Sample events:")
+            emit("📝 Sample events:")
             for event in events[:3]:
-                print(f"  - {event.get('type', 'Unknown')} on {event.get('created_at', 'Unknown date')}")
+                emit(f"  - {event.get('type', 'Unknown')} on {event.get('created_at', 'Unknown date')}")
     except Exception as e:
-        print(f"❌ Failed to fetch user events: {e}")
+        emit(f"❌ Failed to fetch user events: {e}")
         return False
     
+    flush()
     # Test 2: Get repository issues
-    print("\n🐛 Testing repository issues API...")
+    emit("\n🐛 Testing repository issues API...")
     try:
-        issues = service.get_repo_issues("microsoft", "vscode")
-        print(f"✅ Successfully fetched {len(issues)} issues from microsoft/vscode")
+        issues = service.get_repo_issues("microsoft", "vscode", per_page=3, max_pages=1)
+        emit(f"✅ Successfully fetched {len(issues)} issues from microsoft/vscode")
         
         # Show some sample issues
         if issues:
-            print("📝 Sample issues:")
+            emit("📝 Sample issues:")
             for issue in issues[:3]:
-                print(f"  - #{issue.get('number', 'N/A')}: {issue.get('title', 'No title')[:50]}...")
+                emit(f"  - #{issue.get('number', 'N/A')}: {issue.get('title', 'No title')[:50]}...")
     except Exception as e:
-        print(f"❌ Failed to fetch repository issues: {e}")
+        emit(f"❌ Failed to fetch repository issues: {e}")
         return False
     
-    # Test 3: Check rate limits
-    print("\n📈 Checking API rate limits...")
-    try:
-        rate_limit = service.get_rate_limit()
-        if rate_limit:
-            core_limit = rate_limit.get('resources', {}).get('core', {})
-            remaining = core_limit.get('remaining', 0)
-            limit = core_limit.get('limit', 0)
-            reset_time = core_limit.get('reset', 0)
-            
-            print(f"✅ Rate limit status: {remaining}/{limit} requests remaining")
-            print(f"📅 Resets at: {datetime.fromtimestamp(reset_time)}")
-        else:
-            print("⚠️  Could not fetch rate limit info")
-    except Exception as e:
-        print(f"❌ Failed to check rate limits: {e}")
-    
-    print("\n🎉 GitHub API test completed successfully!")
+    emit("\n🎉 GitHub API test completed successfully!")
     return True
 
 if __name__ == "__main__":
-    from datetime import datetime
-    test_github_api()
+    try:
+        test_github_api()
+    finally:
+        flush()